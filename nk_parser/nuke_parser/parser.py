@@ -14,31 +14,63 @@
 from __future__ import annotations
 
 import collections
-import copy
+import concurrent.futures
 import functools
+import hashlib
 import json
+import logging
+import multiprocessing
 import os
+import pickle
 import re
-from typing import Any, Dict, Generator, List, Optional, Tuple, Union
-
-from nuke_parser.stack import Stack
+import sys
+import threading
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 GizmoNameStr = str
 
-_NODE_OPEN_RE = re.compile(r"(?P<type>[\w\.]+)\s\{$")
-_NODE_CLOSE_RE = re.compile(r"\}$")
-_NESTED_KNOB_CLOSE_RE = re.compile(r"^\s+\}\n")
-_BRANCH_STACK_RE = re.compile(r"set (?P<key>\w+) \[stack \d\]")  # set
-_PUSH_RE = re.compile(r"push \$(?P<key>\w+)")
-_VERSION_RE = re.compile(r"version[ ]+(?P<version>[\d\.]+([ ]v\d)?)")
-_CLONE_RE = re.compile(r"clone \$(?P<key>\w+)\s\{")
-_NODE_KNOB_RE = re.compile(r"^\s*(?P<key>[\w_\.]+)[ ]+(?P<value>(:?\"|\w|\{|-|/).*)")
+LOG = logging.getLogger(__name__)
+
+_GIZMO_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "nuke_parser", "gizmos.pkl"
+)
+_GIZMO_CACHE_VERSION = 3  # Bump when the pickled ``Node`` layout changes.
+_GIZMO_LOCK = threading.Lock()
+_GIZMO_MAP: Optional[Dict[GizmoNameStr, Node]] = None  # Guarded by ``_GIZMO_LOCK``.
+
+_KNOB_PATTERN = r"(?P<knob>(?P<key>[\w_\.]+)[ ]+(?P<value>(:?\"|\w|\{|-|/).*))"
+
+# Tokenizers for the two parser states of ``_parseNk``. The branch is dispatched on
+# ``match.lastgroup`` so each line only runs through the regex engine once.
+# Between nodes: stack commands, node/clone definitions and script knobs (``version``).
+_LINE_RE = re.compile(
+    r"\s*(?:"
+    r"(?P<branch>set (?P<branch_key>\w+) \[stack \d\])"
+    r"|(?P<push>push \$(?P<push_key>\w+))"
+    r"|(?P<clone>clone \$(?P<clone_key>\w+)\s\{)"
+    r"|(?P<node_open>(?P<type>[\w\.]+)\s\{$)"
+    rf"|{_KNOB_PATTERN}"
+    r")"
+)
+# Inside a node definition: knobs (the closing brace is checked without regex).
+_NODE_KNOB_RE = re.compile(rf"\s*{_KNOB_PATTERN}")
 
 
 _GROUP_NODE_CLASSES = ("Group", "Gizmo")
 _ROOT_NODE_CLASSES = ("Root", "LiveGroupInfo")
 
-_USER_KNOB_RE = re.compile(
+# User knobs are only parsed with ``NK_PARSER_EXPERIMENTAL``, see ``_userKnobRe``.
+_USER_KNOB_PATTERN = (
     r"\{\s*(?P<type>\d+)\s+(?P<name>[\w_]+)"
     r'(?:\s+l\s+(?P<label>(?:"([^"]+)")|([\w_:;]+)))?'
     r'(?:\s+t\s+"(?P<tooltip>[^"]+)")?'
@@ -53,22 +85,39 @@ _USER_KNOB_RE = re.compile(
 )
 
 
-_SUPPORTED_KNOB_TYPES = (
-    1,
-    2,
-    3,
-    4,
-    6,
-    7,
-    8,
-    26,
-)
+_ENUM_SPLIT_RE = re.compile(r"\s+")
+
+# User knob type -> decoder of ``_userKnobRe`` groups. Other types are not supported.
 # https://learn.foundry.com/nuke/developers/63/ndkdevguide/knobs-and-handles/knobtypes.html#knobs-knobtypes-text-knob
+_USER_KNOB_DECODERS: Dict[int, Callable[[Dict[str, Optional[str]]], Any]] = {
+    1: lambda groups: groups["value"] or "",  # String
+    2: lambda groups: groups["value"] or "",  # File
+    3: lambda groups: int(groups["value"] or 0),  # Integer
+    4: lambda groups: _ENUM_SPLIT_RE.split(groups["enum_items"] or "", 1)[0],  # Enum
+    6: lambda groups: int(groups["value"] or 0),  # Boolean
+    7: lambda groups: float(groups["value"] or 0),  # Double
+    8: lambda groups: float(groups["value"] or 0),  # Float
+    26: lambda groups: groups["value"] or "",  # Text
+}
 
 
 class Node:
     """Class representing nuke nodes."""
 
+    # Scripts can hold tens of thousands of nodes, skip the per instance ``__dict__``.
+    __slots__ = (
+        "_knobs",
+        "_class",
+        "_inputs",
+        "_outputs",
+        "_children",
+        "_parent",
+        "_is_gizmo",
+        "_clone_suffix",
+        "_source_node",
+        "_clones",
+    )
+
     def __init__(self, class_: str, knobs: dict):
         """Initialize class and do nothing.
 
@@ -82,8 +131,8 @@ class Node:
         }
         self._knobs.update(knobs)
         self._class = class_
-        self._inputs: List[Node] = [None] * eval(str(self._knobs.get("inputs")))
-        self._outputs: List[Node] = []
+        self._inputs: List[Node] = [None] * _inputCount(self._knobs.get("inputs"))
+        self._outputs: Dict[Node, None] = {}  # Insertion ordered set of output nodes.
         self._children: List[Node] = []
         self._parent: Optional[Node] = None
 
@@ -160,11 +209,12 @@ class Node:
 
     def fullName(self) -> str:
         node = self
-        path = []
-        while node and node.Class() != "Root":
-            path.insert(0, node.name())
-            node = node.parent()
-        return ".".join(path)
+        names = []
+        # Read the slots directly, this runs for every ancestor.
+        while node and node._class != "Root":
+            names.append(node._knobs.get("name", ""))
+            node = node._parent
+        return ".".join(reversed(names))
 
     def _addChild(self, child: Node) -> None:
         """Add child to node. This should only be called from the nk_parser.
@@ -215,13 +265,12 @@ class Node:
 
         """
         old_input = self._inputs[i]
-        if old_input and self in old_input._outputs:
-            index = old_input._outputs.index(self)
-            old_input._outputs[index] = None
-
         self._inputs[i] = node
+        if old_input and old_input not in self._inputs:
+            old_input._outputs.pop(self, None)
+
         if node:
-            node._outputs.append(self)
+            node._outputs[self] = None
 
     def knobs(self) -> Dict[str, Any]:
         """All knob names.
@@ -230,7 +279,11 @@ class Node:
             All knobs as dict.
 
         """
-        return copy.deepcopy(self._knobs)
+        # Knob values are almost always immutable, only copy the containers.
+        return {
+            key: _copyKnobValue(value) if isinstance(value, (list, dict)) else value
+            for key, value in self._knobs.items()
+        }
 
     def knob(self, name: str, default=None) -> Any:
         """Get knob value from knob name.
@@ -284,20 +337,17 @@ class Node:
         return name in self._knobs
 
     def _allNodes(self) -> Generator[Node, None, None]:
-        """Recursively get all child nodes.
+        """Get all child nodes (depth first).
 
         Yields:
             Node: Child nodes.
 
         """
-
-        def travers(node: Node) -> Generator[Node, None, None]:
+        stack = self._children[::-1]
+        while stack:
+            node = stack.pop()
             yield node
-            for _child in node.children():
-                yield from travers(_child)
-
-        for child in self.children():
-            yield from travers(child)
+            stack.extend(reversed(node._children))
 
     def allNodes(self, filters: Optional[Tuple[str, ...]] = tuple()) -> Tuple[Node]:
         """Get all child nodes.
@@ -309,13 +359,9 @@ class Node:
             All child nodes if no filter was used, else only nodes that match classes in filters.
 
         """
-        return tuple(
-            [
-                node
-                for node in self._allNodes()
-                if not filters or node.Class() in filters
-            ]
-        )
+        if not filters:
+            return tuple(self._allNodes())
+        return tuple([node for node in self._allNodes() if node._class in filters])
 
     def path(self) -> str:
         """Get node path from node.
@@ -325,13 +371,21 @@ class Node:
 
         """
         node = self
-        path = ""
+        names = []
+        # Read the slots directly (same as ``nodeName``), this runs for every ancestor.
         while node:
             # The name of Root is the file path. We don't want that.
-            name = node.nodeName()
-            path = "/" + name + path
-            node = node.parent()
-        return path + self._clone_suffix
+            names.append(
+                node._knobs.get("name", "") if node._class != "Root" else "Root"
+            )
+            node = node._parent
+        return "/" + "/".join(reversed(names)) + self._clone_suffix
+
+
+# First characters json can start a document with (including leading whitespace).
+_JSON_START_CHARS = frozenset('-0123456789tfnNI["{ \t\n\r')
+# Long values (expressions, scripts) rarely repeat, don't let them fill the cache.
+_MAX_CACHED_KNOB_LENGTH = 64
 
 
 def decodeKnob(value: str) -> Any:
@@ -344,7 +398,35 @@ def decodeKnob(value: str) -> Any:
         Decoded knob value.
 
     """
-    value = value.replace("\\n", "\n").replace("\\", "")
+    if "\\" in value:
+        value = value.replace("\\n", "\n").replace("\\", "")
+    elif value == "true" or value == "false":
+        return value == "true"
+
+    digits = value[1:] if value[:1] == "-" else value
+    if digits.isdigit() and digits.isascii() and (digits[0] != "0" or digits == "0"):
+        return int(value)
+    if not value or value[0] not in _JSON_START_CHARS:
+        return value  # Can't be valid json, skip the decoder.
+
+    if len(value) > _MAX_CACHED_KNOB_LENGTH:
+        return _decodeJsonKnob.__wrapped__(value)
+    result = _decodeJsonKnob(value)
+    # The cached result is shared, hand out a copy of mutable values.
+    return _copyKnobValue(result) if isinstance(result, list) else result
+
+
+@functools.lru_cache(maxsize=1 << 15)
+def _decodeJsonKnob(value: str) -> Any:
+    """Decode json knob value. Scripts repeat the same values (e.g. ``0.5``) a lot.
+
+    Args:
+        value: Encoded knob value.
+
+    Returns:
+        Decoded knob value or value if it isn't json.
+
+    """
     try:
         result = json.loads(value)  # Nuke does not have dict attributes.
         return result if not isinstance(result, dict) else value
@@ -352,6 +434,56 @@ def decodeKnob(value: str) -> Any:
         return value
 
 
+def _copyKnobValue(value: Any) -> Any:
+    """Copy the containers of a decoded knob value.
+
+    Decoded values only hold json types, so this skips the memo and dispatch of
+    ``copy.deepcopy``.
+
+    Args:
+        value: Decoded knob value.
+
+    Returns:
+        Copy of value.
+
+    """
+    if isinstance(value, list):
+        return [
+            _copyKnobValue(item) if isinstance(item, (list, dict)) else item
+            for item in value
+        ]
+    if isinstance(value, dict):
+        return {
+            key: _copyKnobValue(item) if isinstance(item, (list, dict)) else item
+            for key, item in value.items()
+        }
+    return value
+
+
+def _inputCount(value: Any) -> int:
+    """Get the number of inputs from an ``inputs`` knob value.
+
+    Nuke writes the mask input as an addition, e.g. ``inputs 2+1``.
+
+    Args:
+        value: Decoded ``inputs`` knob value.
+
+    Returns:
+        Number of inputs.
+
+    """
+    if isinstance(value, int):
+        return value
+    parts = [part for part in str(value).split("+") if part.strip()]
+    return sum(int(part) for part in parts) if parts else 1
+
+
+@functools.lru_cache(maxsize=None)
+def _userKnobRe() -> re.Pattern:
+    """Compile the user knob regex on first use instead of on import."""
+    return re.compile(_USER_KNOB_PATTERN)
+
+
 def parseUserKnob(knobs: Dict[str, Any], string: str) -> None:
     """Parse user knob.
 
@@ -360,25 +492,14 @@ def parseUserKnob(knobs: Dict[str, Any], string: str) -> None:
         string: Command to parse.
 
     """
-    match = _USER_KNOB_RE.search(string)
+    match = _userKnobRe().search(string)
     if not match:
         return
 
     groups = match.groupdict()
-    knob_type = int(groups.get("type", 0))
-    knob_name = groups.get("name")
-    if knob_type not in _SUPPORTED_KNOB_TYPES:
-        return
-    if knob_type in (1, 2, 26):
-        knobs[knob_name] = groups.get("value") or ""
-    elif knob_type in (3, 6):
-        knobs[knob_name] = int(groups.get("value") or 0)
-    elif knob_type == 4:
-        items_string = groups.get("enum_items")
-        knobs[knob_name] = re.split(r"\s+", items_string)[0]
-
-    elif knob_type in (7, 8):
-        knobs[knob_name] = float(groups.get("value") or 0)
+    decoder = _USER_KNOB_DECODERS.get(int(groups["type"]))
+    if decoder:
+        knobs[groups["name"]] = decoder(groups)
 
 
 def _parseNk(file_path: str, gizmos: Optional[dict] = None) -> Node:
@@ -394,126 +515,155 @@ def _parseNk(file_path: str, gizmos: Optional[dict] = None) -> Node:
     """
     gizmos = gizmos or {}
 
-    with open(file_path) as file:
-        lines = iter(file.readlines())
-
-    main_stack = Stack[Node]()
+    main_stack: List[Optional[Node]] = []
     node_map: Dict[str, Node] = {}
     knobs = {}
     class_ = ""
-    parents_stack = Stack[Node]()
+    parents_stack: List[Node] = []
     clone_map = collections.defaultdict(int)
+    # Gizmo nodes are named after their file.
+    gizmo_name = os.path.splitext(os.path.basename(file_path))[0]
 
     if file_path.endswith(".gizmo"):
         root = Node("Root", {})
-        parents_stack.push(root)
-        main_stack.push(root)
+        parents_stack.append(root)
+        main_stack.append(root)
+
+    # Local aliases of the methods called for every line.
+    match_line = _LINE_RE.match
+    match_knob = _NODE_KNOB_RE.match
+    intern = sys.intern
+    decode = decodeKnob
+
+    # Iterate the file lazily, multi-line knob values pull their extra lines with next()
+    with open(file_path, buffering=1 << 17) as lines:
+        for line in lines:
+            if class_:
+                # Inside a node definition, skip the stack command checks. Knob lines
+                # are far more common than the closing brace, so try them first.
+                match = match_knob(line)
+                if match:
+                    tag = "knob"
+                else:
+                    tag = "node_close" if line.strip() == "}" else None
+            else:
+                # Commands are the first token on a line. A prefix check avoids
+                # scanning long knob values (that may contain the same words) for them.
+                command = line.lstrip()
+                if not command or command[0] == "#":
+                    continue  # Blank line or comment (e.g. the ``#! nuke`` header).
+                elif command.startswith("push 0"):
+                    main_stack.append(None)
+                    continue
+                elif command.startswith("end_group"):
+                    node_to_find = parents_stack[-1]
+                    node = main_stack.pop() if main_stack else None
+                    while node != node_to_find and main_stack:
+                        node = main_stack.pop()
+                    main_stack.append(node_to_find)
+                    parents_stack.pop()
+                    continue
 
-    for line in lines:
-        if "push 0" in line:
-            main_stack.push(None)
-            continue
-        elif _BRANCH_STACK_RE.search(line):  # set stack-key
-            key = _BRANCH_STACK_RE.search(line).group("key")
-            if key in "cut_paste_input":
-                parents_stack.push(Node("Root", {}))
-                continue
+                match = match_line(command)
+                tag = match.lastgroup if match else None
 
-            node_map[key] = main_stack.peek()
-            continue
+            if tag == "branch":  # set stack-key
+                key = match.group("branch_key")
+                if key in "cut_paste_input":
+                    parents_stack.append(Node("Root", {}))
+                    continue
 
-        elif _PUSH_RE.search(line):
-            key = _PUSH_RE.search(line).group("key")
-            main_stack.push(node_map.get(key))
-            continue
-        elif "end_group" in line:
-            node_to_find = parents_stack.peek()
-            node = main_stack.pop()
-            while node != node_to_find and not main_stack.empty():
-                node = main_stack.pop()
-            main_stack.push(node_to_find)
-            parents_stack.pop()
-            continue
+                node_map[key] = main_stack[-1]
+                continue
 
-        elif _CLONE_RE.search(line) and not class_:
-            key = _CLONE_RE.search(line).group("key")
-            node_to_clone = node_map[key]
-            class_ = node_to_clone.Class()
-            knobs = copy.deepcopy(node_to_clone._knobs)
-            knobs.pop("inputs", None)
-
-            clone_map[key] += 1
-            knobs["__clone__"] = f"_{clone_map[key]}"
-            knobs["__source__"] = node_to_clone
-
-        elif _NODE_OPEN_RE.search(line) and not class_:
-            class_ = _NODE_OPEN_RE.search(line).group("type")
-            if gizmos.get(class_):
-                knobs.update(gizmos[class_].knobs())
-            if class_ == "Gizmo":
-                knobs["name"] = os.path.splitext(os.path.basename(file_path))[0]
-
-        elif _NODE_KNOB_RE.search(line):
-            match = _NODE_KNOB_RE.search(line)
-            value = match.group("value")
-            if not value.startswith(("{", '"')):
-                knobs[match.group("key")] = decodeKnob(value)
+            elif tag == "push":
+                main_stack.append(node_map.get(match.group("push_key")))
                 continue
 
-            string = value
-            if value.startswith('"'):
-                count = value.count('"') - value.count('\\"')
-                while count % 2 != 0:
-                    line = next(lines)
-                    count += line.count('"') - line.count('\\"')
-                    string += line
-                # Remove first and last quote to help the if the string holds serialized json.
-                string = f"{string[1:-1]}" if len(string) > 1 else string
-            elif value.startswith("{"):
-                count = value.count("{") - value.count("}")
-                while count:
-                    line = next(lines)
-                    count += line.count("{") - line.count("}")
-                    string += line
-
-            if match.group("key") == "addUserKnob" and os.getenv(
-                "NK_PARSER_EXPERIMENTAL"
-            ):
-                parseUserKnob(knobs, string)
+            elif tag == "clone":
+                key = match.group("clone_key")
+                node_to_clone = node_map[key]
+                class_ = node_to_clone.Class()
+                knobs = node_to_clone.knobs()
+                knobs.pop("inputs", None)
+
+                clone_map[key] += 1
+                knobs["__clone__"] = f"_{clone_map[key]}"
+                knobs["__source__"] = node_to_clone
+
+            elif tag == "node_open":
+                class_ = intern(match.group("type"))
+                if gizmos.get(class_):
+                    knobs.update(gizmos[class_].knobs())
+                if class_ == "Gizmo":
+                    knobs["name"] = gizmo_name
+
+            elif tag == "knob":
+                # Knob names repeat on every node, intern them to share one string.
+                key = intern(match.group("key"))
+                value = match.group("value")
+                # The knob pattern never matches an empty value.
+                if value[0] not in '{"':
+                    knobs[key] = decode(value)
+                    continue
+
+                # Collect the lines of multi-line values and join them once, adding
+                # to a growing string would copy it for every line.
+                parts = [value]
+                if value.startswith('"'):
+                    count = value.count('"') - value.count('\\"')
+                    while count % 2 != 0:
+                        line = next(lines)
+                        count += line.count('"') - line.count('\\"')
+                        parts.append(line)
+                    string = "".join(parts)
+                    # Remove first and last quote to help the if the string holds serialized json.
+                    string = f"{string[1:-1]}" if len(string) > 1 else string
+                else:
+                    count = value.count("{") - value.count("}")
+                    while count:
+                        line = next(lines)
+                        count += line.count("{") - line.count("}")
+                        parts.append(line)
+                    string = "".join(parts)
+
+                if key == "addUserKnob" and os.getenv(
+                    "NK_PARSER_EXPERIMENTAL"
+                ):
+                    parseUserKnob(knobs, string)
+                    continue
+                knobs[key] = decode(string)
                 continue
-            knobs[match.group("key")] = decodeKnob(string)
-            continue
 
-        elif _NODE_CLOSE_RE.search(line) and class_:
-            nk_node = Node(class_, knobs)
-            class_ = ""
-            knobs = {}
-            for index in range(eval(str(nk_node.knob("inputs")))):
-                node = main_stack.pop()
+            elif tag == "node_close":
+                nk_node = Node(class_, knobs)
+                class_ = ""
+                knobs = {}
+                for index in range(len(nk_node._inputs)):
+                    node = main_stack.pop() if main_stack else None
 
-                # Add connections.
-                nk_node.setInput(index, node)
+                    # Add connections.
+                    nk_node.setInput(index, node)
 
-            if gizmos.get(nk_node.Class()):
-                nk_node._children.extend(
-                    copy.deepcopy(gizmos[nk_node.Class()].children())
-                )
-                nk_node._is_gizmo = True
+                if gizmos.get(nk_node.Class()):
+                    for child in _copyNodeTrees(gizmos[nk_node.Class()]._children):
+                        nk_node._addChild(child)
+                    nk_node._is_gizmo = True
 
-            if nk_node.Class() == "LiveGroup":
-                _parseLiveGroup(nk_node, gizmos)
+                if nk_node.Class() == "LiveGroup":
+                    _parseLiveGroup(nk_node, gizmos)
 
-            main_stack.push(nk_node)
-            if nk_node.Class() in _ROOT_NODE_CLASSES:
-                parents_stack.push(nk_node)
-                continue
+                main_stack.append(nk_node)
+                if nk_node.Class() in _ROOT_NODE_CLASSES:
+                    parents_stack.append(nk_node)
+                    continue
 
-            parents_stack.peek()._addChild(nk_node)
-            # Deal with groups
-            if nk_node.Class() in _GROUP_NODE_CLASSES or (
-                nk_node.Class() == "LiveGroup" and nk_node.knob("modified")
-            ):
-                parents_stack.push(nk_node)
+                parents_stack[-1]._addChild(nk_node)
+                # Deal with groups
+                if nk_node.Class() in _GROUP_NODE_CLASSES or (
+                    nk_node.Class() == "LiveGroup" and nk_node.knob("modified")
+                ):
+                    parents_stack.append(nk_node)
 
     return parents_stack.pop() if parents_stack else Node("Root", {})
 
@@ -537,42 +687,359 @@ def _parseLiveGroup(live_group: Node, gizmos: Dict[str, Node]) -> None:
     del root
 
 
+def _copyNodeTrees(nodes: List[Node]) -> List[Node]:
+    """Copy nodes and all their descendants.
+
+    Connections, clones and parents between the copied nodes point to the copies.
+    Connections to nodes outside the copied trees are dropped, copies of clones with
+    a source outside the copied trees point to that source without being added to its
+    clones (the source may belong to a cached gizmo shared between parses). Unlike
+    ``copy.deepcopy`` this doesn't copy everything reachable from the nodes (e.g. the
+    parent gizmo and the rest of its file).
+
+    Args:
+        nodes: Nodes to copy.
+
+    Returns:
+        Copies of nodes without a parent.
+
+    """
+    originals = []
+    stack = nodes[::-1]
+    while stack:
+        node = stack.pop()
+        originals.append(node)
+        stack.extend(reversed(node._children))
+
+    copies: Dict[Node, Node] = {}
+    for node in originals:
+        node_copy = Node.__new__(Node)
+        node_copy._knobs = node.knobs()
+        node_copy._class = node._class
+        node_copy._is_gizmo = node._is_gizmo
+        node_copy._clone_suffix = node._clone_suffix
+        copies[node] = node_copy
+
+    for node in originals:
+        node_copy = copies[node]
+        node_copy._inputs = [copies.get(input_) for input_ in node._inputs]
+        node_copy._outputs = {
+            copies[output]: None for output in node._outputs if output in copies
+        }
+        node_copy._children = [copies[child] for child in node._children]
+        node_copy._parent = copies.get(node._parent)
+        # A source outside the copied trees is shared, it's never written to.
+        node_copy._source_node = copies.get(node._source_node, node._source_node)
+        # Clones outside the copied trees keep the original as their source.
+        node_copy._clones = [copies[clone] for clone in node._clones if clone in copies]
+
+    return [copies[node] for node in nodes]
+
+
 def _gizmoPaths() -> List[str]:
     """Get all .gizmo file paths from ``NUKE_PATH`` env."""
     gizmo_paths = []
     for nuke_path in os.getenv("NUKE_PATH", "").split(os.path.pathsep):
-        for root, _, files in os.walk(nuke_path):
-            for file in files:
-                if not file.endswith(".gizmo"):
-                    continue
+        if not nuke_path:
+            continue
+
+        # Same order as a top down ``os.walk`` (that doesn't follow links), without
+        # building the lists of every file name per directory.
+        stack = [nuke_path]
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                continue
 
-                gizmo_paths.append(os.path.join(root, file))
+            sub_dirs = []
+            with entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        if not entry.is_symlink():
+                            sub_dirs.append(entry.path)
+                    elif entry.name.endswith(".gizmo"):
+                        gizmo_paths.append(entry.path)
+            stack.extend(reversed(sub_dirs))
 
     return gizmo_paths
 
 
-@functools.lru_cache()
-def _parseGizmos() -> Dict[GizmoNameStr, Node]:
-    """Parse all gizmo nodes and return map."""
-    gizmos = {}
-    for gizmo_path in _gizmoPaths():
-        root = _parseNk(gizmo_path)
-        if not root:
+def _gizmoCacheKey(gizmo_paths: List[str]) -> str:
+    """Get key identifying the current state of the gizmo files.
+
+    Args:
+        gizmo_paths: Gizmo file paths.
+
+    Returns:
+        Digest of the file paths and their modification times.
+
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(
+        f"{_GIZMO_CACHE_VERSION}:{os.getenv('NK_PARSER_EXPERIMENTAL', '')}".encode()
+    )
+    for gizmo_path in gizmo_paths:
+        digest.update(f"\0{gizmo_path}\0{os.stat(gizmo_path).st_mtime_ns}".encode())
+    return digest.hexdigest()
+
+
+def _flattenGizmos(gizmos: Dict[GizmoNameStr, Node]) -> Tuple[list, Dict[str, int]]:
+    """Flatten gizmo nodes to a list with index based links.
+
+    Pickling ``Node`` objects directly recurses once per linked node, long node chains
+    hit the recursion limit.
+
+    Args:
+        gizmos: Gizmo map to flatten.
+
+    Returns:
+        Node records and gizmo name -> index of the gizmo record.
+
+    """
+    indices: Dict[Node, int] = {}
+    nodes: List[Node] = []
+    stack = list(gizmos.values())
+    while stack:
+        node = stack.pop()
+        if node is None or node in indices:
             continue
+        indices[node] = len(nodes)
+        nodes.append(node)
+        stack.extend(node._inputs)
+        stack.extend(node._outputs)
+        stack.extend(node._children)
+        stack.append(node._parent)
+        stack.append(node._source_node)
+        stack.extend(node._clones)
+
+    def index(node: Optional[Node]) -> int:
+        return -1 if node is None else indices[node]
+
+    records = [
+        (
+            node._class,
+            node._knobs,
+            node._is_gizmo,
+            node._clone_suffix,
+            [index(input_) for input_ in node._inputs],
+            [indices[output] for output in node._outputs],
+            [indices[child] for child in node._children],
+            index(node._parent),
+            index(node._source_node),
+            [indices[clone] for clone in node._clones],
+        )
+        for node in nodes
+    ]
+    return records, {name: indices[gizmo] for name, gizmo in gizmos.items()}
+
+
+def _unflattenGizmos(
+    records: list, gizmo_indices: Dict[str, int]
+) -> Dict[GizmoNameStr, Node]:
+    """Rebuild gizmo nodes from ``_flattenGizmos`` output.
+
+    Args:
+        records: Node records.
+        gizmo_indices: Gizmo name -> index of the gizmo record.
+
+    Returns:
+        Gizmo map.
+
+    """
+    nodes = [Node.__new__(Node) for _ in records]
+
+    def node_at(index: int) -> Optional[Node]:
+        return None if index < 0 else nodes[index]
+
+    for node, record in zip(nodes, records):
+        (
+            node._class,
+            node._knobs,
+            node._is_gizmo,
+            node._clone_suffix,
+            inputs,
+            outputs,
+            children,
+            parent,
+            source,
+            clones,
+        ) = record
+        node._inputs = [node_at(index) for index in inputs]
+        node._outputs = {nodes[index]: None for index in outputs}
+        node._children = [nodes[index] for index in children]
+        node._parent = node_at(parent)
+        node._source_node = node_at(source)
+        node._clones = [nodes[index] for index in clones]
+    return {name: nodes[index] for name, index in gizmo_indices.items()}
+
+
+def _loadGizmoCache(key: str) -> Optional[Dict[GizmoNameStr, Node]]:
+    """Load parsed gizmos from the on disk cache.
+
+    Args:
+        key: Expected cache key.
+
+    Returns:
+        Gizmo map if the cache is valid else None.
+
+    """
+    try:
+        with open(_GIZMO_CACHE_PATH, "rb") as f:
+            cache_key, records, gizmo_indices = pickle.load(f)
+        if cache_key != key:
+            return None
+        return _unflattenGizmos(records, gizmo_indices)
+    except Exception:  # Missing, corrupt or incompatible cache.
+        return None
+
+
+def _saveGizmoCache(key: str, gizmos: Dict[GizmoNameStr, Node]) -> None:
+    """Save parsed gizmos to the on disk cache.
+
+    Args:
+        key: Cache key of the gizmo files.
+        gizmos: Gizmo map to save.
+
+    """
+    tmp_path = f"{_GIZMO_CACHE_PATH}.{os.getpid()}"
+    try:
+        os.makedirs(os.path.dirname(_GIZMO_CACHE_PATH), exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            pickle.dump(
+                (key, *_flattenGizmos(gizmos)), f, protocol=pickle.HIGHEST_PROTOCOL
+            )
+        os.replace(tmp_path, _GIZMO_CACHE_PATH)
+    except (OSError, pickle.PicklingError, RecursionError) as error:
+        # The cache is only an optimization.
+        LOG.warning("Failed to write gizmo cache %s: %s", _GIZMO_CACHE_PATH, error)
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _fileGizmos(gizmo_path: str) -> Dict[GizmoNameStr, Node]:
+    """Parse gizmo file and return map of the gizmos it defines.
+
+    Args:
+        gizmo_path: Gizmo file path.
+
+    Returns:
+        Dict of {gizmo name: Gizmo node}.
+
+    """
+    gizmos = {}
+    root = _parseNk(gizmo_path)
+    if root:
         for gizmo in root.children():
             gizmos[gizmo.name()] = gizmo
             gizmos[f"{gizmo.name()}.gizmo"] = gizmo
     return gizmos
 
 
-def parseNk(file_path: str) -> Node:
+def _flatFileGizmos(gizmo_path: str) -> Tuple[list, Dict[str, int]]:
+    """Worker process version of ``_fileGizmos`` returning ``_flattenGizmos`` output.
+
+    Pickling the nodes themselves to send them back recurses once per linked node.
+
+    """
+    return _flattenGizmos(_fileGizmos(gizmo_path))
+
+
+def _parseGizmoFiles(
+    gizmo_paths: List[str], workers: int
+) -> Iterator[Dict[GizmoNameStr, Node]]:
+    """Parse gizmo files, in worker processes if requested.
+
+    Args:
+        gizmo_paths: Gizmo file paths to parse.
+        workers: Max number of worker processes, 0 or 1 parses in this process.
+
+    Yields:
+        Gizmo map of each file in ``gizmo_paths`` order.
+
+    """
+    if workers < 2 or len(gizmo_paths) < 2:
+        for gizmo_path in gizmo_paths:
+            yield _fileGizmos(gizmo_path)
+        return
+
+    workers = min(workers, len(gizmo_paths))
+    # Spawn (not fork) workers, the caller may be a multithreaded gui application.
+    context = multiprocessing.get_context("spawn")
+    with concurrent.futures.ProcessPoolExecutor(workers, context) as executor:
+        for records, gizmo_indices in executor.map(
+            _flatFileGizmos,
+            gizmo_paths,
+            chunksize=max(1, len(gizmo_paths) // (workers * 4)),
+        ):
+            yield _unflattenGizmos(records, gizmo_indices)
+
+
+def _parseGizmos(workers: int = 0) -> Dict[GizmoNameStr, Node]:
+    """Parse all gizmo nodes and return map.
+
+    Thread safe, concurrent callers wait for the first call to finish and share its result.
+
+    Args:
+        workers: Max number of worker processes used if the gizmos aren't cached on
+            disk, see ``parseNk``.
+
+    """
+    global _GIZMO_MAP
+    with _GIZMO_LOCK:
+        if _GIZMO_MAP is None:
+            _GIZMO_MAP = _gizmoMap(workers)
+        return _GIZMO_MAP
+
+
+def _gizmoMap(workers: int) -> Dict[GizmoNameStr, Node]:
+    """Parse all gizmo nodes and return map.
+
+    The result is cached on disk until a gizmo file is added, removed or modified.
+
+    Args:
+        workers: Max number of worker processes used to parse the gizmo files.
+
+    """
+    gizmo_paths = _gizmoPaths()
+    if not gizmo_paths:
+        return {}
+
+    try:
+        key = _gizmoCacheKey(gizmo_paths)
+    except OSError:
+        key = None
+
+    gizmos = _loadGizmoCache(key) if key else None
+    if gizmos is not None:
+        return gizmos
+
+    gizmos = {}
+    for file_gizmos in _parseGizmoFiles(gizmo_paths, workers):
+        gizmos.update(file_gizmos)
+
+    if key:
+        _saveGizmoCache(key, gizmos)
+    return gizmos
+
+
+def parseNk(file_path: str, gizmo_workers: int = 0) -> Node:
     """Parse nuke script and return root node.
 
     Args:
         file_path: File path to nuke script.
+        gizmo_workers: Max number of worker processes used to parse the ``NUKE_PATH``
+            gizmos when they aren't cached yet, 0 parses them in this process. Worker
+            processes are spawned with ``sys.executable`` and import the caller's
+            ``__main__`` module, only use this from a python interpreter with an
+            ``if __name__ == "__main__":`` guard (not from inside Nuke).
 
     Returns:
-        Root node of nuke scene description.
+        Root node of nuke scene description, an empty Root for a script without nodes.
 
     """
-    return _parseNk(file_path, _parseGizmos())
+    return _parseNk(file_path, _parseGizmos(gizmo_workers))
@@ -20,7 +20,7 @@ import sys
 
 import nkview
 from nkview import utils
-from nkview.constants import QT_STYLE
+from nkview.constants import qtStyle
 from nkview.graph_view import NukeNodeGraphWidget
 from nkview.outliner import OutlinerWidget
 from nkview.qt import QtCore, QtGui, QtWebEngineWidgets, QtWidgets
@@ -53,6 +53,13 @@ class DocsWidget(QtWidgets.QDialog):
         self.web_view.load(QtCore.QUrl(url))
 
 
+class _GizmoLoader(QtCore.QRunnable):
+    """Parse gizmos in the background to not delay the application startup."""
+
+    def run(self) -> None:
+        _parseGizmos()
+
+
 class NkViewMainWindow(QtWidgets.QMainWindow):
     """Main application window."""
 
@@ -61,7 +68,7 @@ class NkViewMainWindow(QtWidgets.QMainWindow):
         self.setWindowTitle("NkView")
         self.setWindowIcon(QtGui.QIcon(":nuke.png"))
         self.resize(1500, 800)
-        self.setStyleSheet(QT_STYLE)
+        self.setStyleSheet(qtStyle())
 
         self.outliner = OutlinerWidget(self)
 
@@ -160,11 +167,11 @@ def run() -> None:
     app.setWindowIcon(QtGui.QIcon(":nuke.png"))
     app.setStyle("Fusion")
     win = NkViewMainWindow()
+    win.show()
 
-    # Load gizmos.
-    _parseGizmos()
+    # Load gizmos. Loading a nuke script before they are parsed waits for the loader.
+    QtCore.QThreadPool.globalInstance().start(_GizmoLoader())
 
     if args.open:
         win.loadNk(args.open)
-    win.show()
     sys.exit(app.exec())
@@ -11,13 +11,22 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import functools
+from typing import Tuple
+
 from nkview.icons import qresource
-from nkview.qt import QtGui
+from nkview.qt import QtCore, QtGui
 
 qresource.qInitResources()
 
+
+def _polygon(*points: Tuple[float, float]) -> QtGui.QPolygonF:
+    """Create node shape polygon from 2D (unit size) vertices."""
+    return QtGui.QPolygonF([QtCore.QPointF(x, y) for x, y in points])
+
+
 # fmt: off
-BASE_SHAPE = (
+BASE_SHAPE = _polygon(
     (-0.1, 0.0),
     (1.1, 0.0),
     (1.1, 0.25),
@@ -25,25 +34,25 @@ BASE_SHAPE = (
 )
 
 
-GEO_SHAPE = [
-    [0, 0.26],
-    [0.0121, 0.2884],
-    [0.0406, 0.3],
-    [0.96, 0.3],
-    [0.9869, 0.2893],
-    [1, 0.26],
-    [1, 0.04],
-    [0.9879, 0.0116],
-    [0.9594, 0],
-    [0.04, 0],
-    [0.0131, 0.0107],
-    [0, 0.04],
-]
+GEO_SHAPE = _polygon(
+    (0, 0.26),
+    (0.0121, 0.2884),
+    (0.0406, 0.3),
+    (0.96, 0.3),
+    (0.9869, 0.2893),
+    (1, 0.26),
+    (1, 0.04),
+    (0.9879, 0.0116),
+    (0.9594, 0),
+    (0.04, 0),
+    (0.0131, 0.0107),
+    (0, 0.04),
+)
 
 
 
 
-READ_SHAPE = (
+READ_SHAPE = _polygon(
     (0.0, 0.0),
     (1.0, 0.0),
     (1.0, 1.0),
@@ -51,7 +60,7 @@ READ_SHAPE = (
 )
 
 
-VIEWER_SHAPE = (
+VIEWER_SHAPE = _polygon(
     (0.0, 0.1),  # left center
     (0.05, 0.0),
     (0.95, 0.0),
@@ -61,7 +70,7 @@ VIEWER_SHAPE = (
 )
 
 
-GIZMO_SHAPE = (
+GIZMO_SHAPE = _polygon(
     (0.0, 0.0),
     (0.9, 0.0),
     (1.0, 0.15),  # right center.
@@ -69,7 +78,7 @@ GIZMO_SHAPE = (
     (0.0, 0.3),
 )
 
-GROUP_SHAPE = (
+GROUP_SHAPE = _polygon(
     (0.0, 0.15),  # left center
     (0.1, 0.0),
     (0.9, 0.0),
@@ -78,7 +87,7 @@ GROUP_SHAPE = (
     (0.1, 0.3),
 )
 
-OUTPUT_SHAPE = (
+OUTPUT_SHAPE = _polygon(
     (0.1, 0.0),
     (0.9, 0.0),
     (1.0, 0.2),
@@ -86,7 +95,7 @@ OUTPUT_SHAPE = (
 )
 
 
-INPUT_SHAPE = (
+INPUT_SHAPE = _polygon(
     (0.0, 0.0),
     (1.0, 0.0),
     (0.9, 0.2),
@@ -94,7 +103,7 @@ INPUT_SHAPE = (
 )
 
 
-SCENE_3D_SHAPE = (
+SCENE_3D_SHAPE = _polygon(
     (0.21, 0.155),
     (0.2135, 0.1996),
     (0.2239, 0.2431),
@@ -137,7 +146,7 @@ SCENE_3D_SHAPE = (
     (0.2135, 0.1104),
 )
 
-DOT_SHAPE = (
+DOT_SHAPE = _polygon(
     (0.1, 0.0),
     (0.1309, 0.0049),
     (0.1588, 0.0191),
@@ -173,7 +182,11 @@ CLICKED_COLOR = QtGui.QColor(
     SELECTED_COLOR.red(), SELECTED_COLOR.green(), SELECTED_COLOR.blue(), 180
 )
 
-QT_STYLE = f"""
+
+@functools.lru_cache(maxsize=1)
+def qtStyle() -> str:
+    """Get the application style sheet (built on first use)."""
+    return f"""
 QWidget
 {{
     color: white;
@@ -13,9 +13,8 @@
 # limitations under the License.
 from __future__ import annotations
 
-import platform
 import sys
-from typing import List, Optional, Union, Tuple
+from typing import List, Optional, Set, Union, Tuple
 
 from nkview.gui_nodes import GroupNode, GuiNode
 from nkview.navbar import NavigationBar
@@ -23,18 +22,23 @@ from nkview.qt import QtCore, QtGui, QtWidgets
 from nkview.utils import qt_cursor
 from nuke_parser.parser import parseNk, Node
 
-INT_MAX = sys.maxsize // 2
-INT_MIN = ~sys.maxsize // 2
-if platform.system() == "Windows":
+if sys.platform == "win32":
     # https://github.com/maxWiklund/nuke_parser/issues/1
-    INT_MAX = (2**31) - 1  # Maximum value for a signed 32-bit integer
-    INT_MIN = -(2**31)  # Minimum value for a signed 32-bit integer
+    INT_MAX = 0x7FFFFFFF  # Maximum value for a signed 32-bit integer
+    INT_MIN = -0x80000000  # Minimum value for a signed 32-bit integer
+else:
+    INT_MAX = sys.maxsize >> 1
+    INT_MIN = ~sys.maxsize >> 1
+
+_SCENE_RECT = (INT_MIN // 2, INT_MIN // 2, INT_MAX, INT_MAX)
 
 
 class _PrivateApi:
     """Class to expose private methods of the node graph.
     Use it on your own risk."""
 
+    __slots__ = ("_node_view",)
+
     def __init__(self, node_view: _NkGraphView):
         self._node_view = node_view
 
@@ -54,6 +58,32 @@ class _PrivateApi:
         self._node_view.scene().clearSelection()
 
 
+class _ParseSignals(QtCore.QObject):
+    """Signals of ``_ParseRunnable`` (``QRunnable`` is not a ``QObject``)."""
+
+    finished = QtCore.Signal(object, object)  # Job, root node.
+    failed = QtCore.Signal(object, object)  # Job, exception.
+
+
+class _ParseRunnable(QtCore.QRunnable):
+    """Parse nuke script in a worker thread to keep the UI responsive."""
+
+    def __init__(self, file_path: str):
+        super().__init__()
+        self.setAutoDelete(False)  # Owned by the view until the result is handled.
+        self.file_path = file_path
+        self.signals = _ParseSignals()
+
+    def run(self) -> None:
+        try:
+            root = parseNk(self.file_path)
+        except Exception as error:
+            # Raised again in the gui thread, like loading did before parsing moved here.
+            self.signals.failed.emit(self, error)
+            return
+        self.signals.finished.emit(self, root)
+
+
 class _NkGraphView(QtWidgets.QGraphicsView):
     """Private node graph view to to visualize nuke script."""
 
@@ -65,20 +95,44 @@ class _NkGraphView(QtWidgets.QGraphicsView):
 
     def __init__(self, parent: Optional[QtWidgets.QWidget] = None):
         super().__init__(parent)
+        # Rasterize the graph on the GPU, panning and zooming large scripts is
+        # fill-rate bound with the default raster viewport.
+        surface_format = QtGui.QSurfaceFormat()
+        surface_format.setSamples(4)  # Multisampling for the antialiasing render hint.
+        viewport = QtWidgets.QOpenGLWidget()
+        viewport.setFormat(surface_format)
+        self.setViewport(viewport)
+
         self._scene_map = {}
+        self._parse_job: Optional[_ParseRunnable] = None
+        # Started jobs are kept alive until they report back, also when superseded.
+        self._started_jobs: Set[_ParseRunnable] = set()
         self._last_mouse_pos = QtGui.QCursor.pos()
+        self._zoom_scale = 1.0  # Horizontal scale of the view transform.
+
+        # Rubber band selection changes the selection once per item entering or leaving
+        # the band, emit one ``selectionChanged`` per event loop iteration.
+        self._selection_timer = QtCore.QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(0)
+        self._selection_timer.timeout.connect(self.selectionChanged.emit)
 
         self.setScene(QtWidgets.QGraphicsScene())
         self.centerOn(0, 0)
 
-        self.setSceneRect(INT_MIN / 2, INT_MIN / 2, INT_MAX, INT_MAX)
+        self.setSceneRect(*_SCENE_RECT)
         self.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
         self.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
         self.setRenderHint(QtGui.QPainter.Antialiasing)
+        self.setBackgroundBrush(QtGui.QColor(59, 59, 59))
         self.setMouseTracking(True)
         self.setAcceptDrops(True)
         self.setDragMode(QtWidgets.QGraphicsView.DragMode.RubberBandDrag)
         self.setResizeAnchor(QtWidgets.QGraphicsView.ViewportAnchor.AnchorViewCenter)
+        # The OpenGL viewport repaints the whole framebuffer on every update anyway.
+        self.setViewportUpdateMode(
+            QtWidgets.QGraphicsView.ViewportUpdateMode.FullViewportUpdate
+        )
 
     def setScene(self, scene: Optional[QtWidgets.QGraphicsScene]) -> None:
         """Set scene for view to display and setup selection signal.
@@ -87,9 +141,21 @@ class _NkGraphView(QtWidgets.QGraphicsView):
             scene: Scene to Display.
 
         """
+        previous_scene = self.scene()
+        if scene is previous_scene:
+            return  # E.g. clicking the current group in the nav_bar.
+
+        if previous_scene:
+            # Group scenes are reused, don't stack up connections when revisited.
+            previous_scene.selectionChanged.disconnect(self._scheduleSelectionSync)
+
         super().setScene(scene)
         if scene:
-            scene.selectionChanged.connect(self.selectionChanged.emit)
+            scene.selectionChanged.connect(self._scheduleSelectionSync)
+
+    def _scheduleSelectionSync(self) -> None:
+        """Emit ``selectionChanged`` once the current event has been processed."""
+        self._selection_timer.start()
 
     def setSelectStateOnNode(self, node_path: str, state: bool) -> None:
         """Set selection stata on node.
@@ -103,6 +169,23 @@ class _NkGraphView(QtWidgets.QGraphicsView):
         if gui_node:
             gui_node.setSelected(state)
 
+    def setSelectStateOnNodes(self, node_paths: List[str], state: bool) -> None:
+        """Set selection state on nodes and emit ``selectionChanged`` once.
+
+        Args:
+            node_paths: Paths to nodes to set selection state on.
+            state: If True select nodes else deselect nodes.
+
+        """
+        scene = self.scene()
+        blocked = scene.blockSignals(True)
+        try:
+            for gui_node in filter(None, map(self._scene_map.get, node_paths)):
+                gui_node.setSelected(state)
+        finally:
+            scene.blockSignals(blocked)
+        self.selectionChanged.emit()
+
     def guiNodeFromPath(self, node_path: str) -> Union[GuiNode, None]:
         """Get gui-node form node path.
 
@@ -121,7 +204,8 @@ class _NkGraphView(QtWidgets.QGraphicsView):
             event: Event to process.
 
         """
-        if all(url.path().endswith(".nk") for url in event.mimeData().urls()):
+        urls = event.mimeData().urls()
+        if urls and all(url.toLocalFile().endswith(".nk") for url in urls):
             event.accept()
             return
         event.ignore()
@@ -186,8 +270,7 @@ class _NkGraphView(QtWidgets.QGraphicsView):
         nk_node = gui_node.nk_node
         if nk_node.children() or nk_node.Class() in ("Group", "Root"):
             # Store last viewport position to use when exiting the group.
-            viewport_rect = self.mapToScene(self.viewport().geometry()).boundingRect()
-            self.scene().groupNode().setViewportRect(viewport_rect)
+            self.scene().groupNode().setViewportRect(self.viewportSceneRect())
 
             self.scene().clearSelection()
             self.setScene(gui_node.getScene())
@@ -199,15 +282,33 @@ class _NkGraphView(QtWidgets.QGraphicsView):
                 self.frameSelected()
             self.sceneChanged.emit(gui_node)
 
+    def viewportSceneRect(self) -> QtCore.QRectF:
+        """Get the visible area of the scene.
+
+        The view is only scaled and translated, so mapping two corners is enough.
+
+        Returns:
+            Visible scene rect.
+
+        """
+        rect = self.viewport().rect()
+        return QtCore.QRectF(
+            self.mapToScene(rect.topLeft()), self.mapToScene(rect.bottomRight())
+        )
+
     def frameSelected(self) -> None:
         """Frame selected nodes in graph is nodes are selected else frame scene."""
         selected = self.scene().selectedItems()
-        box = QtCore.QRectF()
-        for item in selected:
-            item: QtWidgets.QGraphicsItem = item
-            box = box.united(item.sceneBoundingRect())
-
-        box = box if selected else self.scene().itemsBoundingRect()
+        if selected:
+            # Reduce the corner coordinates instead of uniting a QRectF per item.
+            x1s, y1s, x2s, y2s = zip(
+                *(item.sceneBoundingRect().getCoords() for item in selected)
+            )
+            box = QtCore.QRectF(
+                QtCore.QPointF(min(x1s), min(y1s)), QtCore.QPointF(max(x2s), max(y2s))
+            )
+        else:
+            box = self.scene().itemsBoundingRect()
 
         box_in_screen_space: QtCore.QRect = self.mapFromScene(box).boundingRect()
 
@@ -221,21 +322,72 @@ class _NkGraphView(QtWidgets.QGraphicsView):
 
         self.fitInView(box, QtCore.Qt.KeepAspectRatio)
 
-    @qt_cursor
     def loadNk(self, file_path: str) -> None:
         """Load nuke script in graph view.
 
+        The script is parsed in a worker thread and displayed when parsed.
+
         Args:
             file_path: File path to nuke script.
 
         """
         if not file_path.endswith(".nk"):
+            self._setParseJob(None)
             self.setScene(QtWidgets.QGraphicsScene())
             self.sceneLoaded.emit(None)
             return
 
+        job = _ParseRunnable(file_path)
+        job.signals.finished.connect(self._nkParsedCallback)
+        job.signals.failed.connect(self._nkParseFailedCallback)
+        self._setParseJob(job)
+        self._started_jobs.add(job)
+        QtCore.QThreadPool.globalInstance().start(job)
+
+    def _setParseJob(self, job: Optional[_ParseRunnable]) -> None:
+        """Set the pending parse job and show the wait cursor while there is one.
+
+        Args:
+            job: Job parsing the script to display or None.
+
+        """
+        if job and not self._parse_job:
+            QtWidgets.QApplication.setOverrideCursor(QtCore.Qt.WaitCursor)
+        elif not job and self._parse_job:
+            QtWidgets.QApplication.restoreOverrideCursor()
+        self._parse_job = job
+
+    def _nkParseFailedCallback(self, job: _ParseRunnable, error: Exception) -> None:
+        """Stop waiting for a script that failed to parse and raise its error.
+
+        Args:
+            job: Job that failed.
+            error: Error raised while parsing.
+
+        """
+        self._started_jobs.discard(job)
+        if job is not self._parse_job:
+            return  # Another script has been loaded since.
+        self._setParseJob(None)
+        raise error
+
+    @qt_cursor
+    def _nkParsedCallback(self, job: _ParseRunnable, root: Node) -> None:
+        """Build and display the scene of a parsed nuke script.
+
+        Args:
+            job: Job that parsed the script.
+            root: Root node of parsed script.
+
+        """
+        self._started_jobs.discard(job)
+        if job is not self._parse_job:
+            return  # Another script has been loaded since.
+        self._setParseJob(None)
+        file_path = job.file_path
+
         self._scene_map = {}
-        self.root = parseNk(file_path)
+        self.root = root
 
         self.gui_root = GroupNode(self.root, self._scene_map)
         self.setScene(self.gui_root.getScene())
@@ -251,11 +403,10 @@ class _NkGraphView(QtWidgets.QGraphicsView):
 
         """
         if event.buttons() == QtCore.Qt.MouseButton.MiddleButton:
-            mouse_delta = self.mapToScene(event.pos()) - self.mapToScene(
-                self._last_mouse_pos
-            )
-
-            self.pan(mouse_delta)
+            # The view is only scaled and translated, convert the pixel delta with the
+            # zoom level instead of mapping both points to the scene.
+            mouse_delta = QtCore.QPointF(event.pos() - self._last_mouse_pos)
+            self.pan(mouse_delta / self._zoom_scale)
             self._last_mouse_pos = event.pos()
             event.accept()
             return
@@ -285,7 +436,7 @@ class _NkGraphView(QtWidgets.QGraphicsView):
         event.accept()
         delta = 1.0
         delta += 0.1 if event.angleDelta().y() > 0 else -0.1
-        horizontal_scale = self.transform().m11() * delta
+        horizontal_scale = self._zoom_scale * delta
 
         # Max zoom in.
         if horizontal_scale > 4 and delta > 1:
@@ -294,6 +445,17 @@ class _NkGraphView(QtWidgets.QGraphicsView):
             QtWidgets.QGraphicsView.ViewportAnchor.AnchorUnderMouse
         )
         self.scale(delta, delta)
+        self._zoom_scale = horizontal_scale
+
+    def fitInView(self, *args) -> None:
+        """Scale the view to fit rect and keep track of the new zoom level.
+
+        Args:
+            args: Arguments forwarded to ``QGraphicsView.fitInView``.
+
+        """
+        super().fitInView(*args)
+        self._zoom_scale = self.transform().m11()
 
     def pan(self, delta: QtCore.QPointF) -> None:
         """Pan view.
@@ -306,16 +468,6 @@ class _NkGraphView(QtWidgets.QGraphicsView):
         self.setTransformationAnchor(QtWidgets.QGraphicsView.ViewportAnchor.NoAnchor)
         self.translate(delta.x(), delta.y())
 
-    def drawBackground(self, painter: QtGui.QPainter, rect: QtCore.QRect) -> None:
-        """Draw graph background.
-
-        Args:
-            painter: Class to paint with.
-            rect: Rect to paint on
-
-        """
-        painter.fillRect(rect, QtGui.QColor(59, 59, 59))
-
 
 class NukeNodeGraphWidget(QtWidgets.QWidget):
     """Nuke node-graph widget."""
@@ -358,11 +510,9 @@ class NukeNodeGraphWidget(QtWidgets.QWidget):
     def selectedNodes(self) -> Tuple[Node, ...]:
         """Get selected nodes as nk_parser nodes."""
         return tuple(
-            [
-                node.nk_node
-                for node in self._view.scene().selectedItems()
-                if isinstance(node, GuiNode)
-            ]
+            node.nk_node
+            for node in self._view.scene().selectedItems()
+            if isinstance(node, GuiNode)
         )
 
     def _sceneLoadedCallback(self, root_node: GroupNode) -> None:
@@ -383,10 +533,7 @@ class NukeNodeGraphWidget(QtWidgets.QWidget):
 
         """
         # Store the current viewport position if the user wants to set into the group again.
-        viewport_rect = self._view.mapToScene(
-            self._view.viewport().geometry()
-        ).boundingRect()
-        self._view.scene().groupNode().setViewportRect(viewport_rect)
+        self._view.scene().groupNode().setViewportRect(self._view.viewportSceneRect())
 
         self._view.setScene(node.getScene())
         self._view.scene().clearSelection()
@@ -400,7 +547,7 @@ class NukeNodeGraphWidget(QtWidgets.QWidget):
     def _selectionChangedCallback(self) -> None:
         """Callback to emit selection change."""
         self.selectionChanged.emit(
-            [gui_node.nk_node.path() for gui_node in self._view.scene().selectedItems()]
+            [gui_node.node_path for gui_node in self._view.scene().selectedItems()]
         )
 
     def showEvent(self, event: QtGui.QShowEvent) -> None:
@@ -420,8 +567,7 @@ class NukeNodeGraphWidget(QtWidgets.QWidget):
             node_paths: Node path to select in view.
 
         """
-        for path in node_paths:
-            self._view.setSelectStateOnNode(path, True)
+        self._view.setSelectStateOnNodes(node_paths, True)
 
     def deselectNodes(self, node_paths: List[str]) -> None:
         """Deselect node in node graph.
@@ -430,8 +576,7 @@ class NukeNodeGraphWidget(QtWidgets.QWidget):
             node_paths: Node path to deselect in view.
 
         """
-        for path in node_paths:
-            self._view.setSelectStateOnNode(path, False)
+        self._view.setSelectStateOnNodes(node_paths, False)
 
     def navigateToNode(self, path: str) -> None:
         """Step into node from node path.
@@ -449,19 +594,20 @@ class NukeNodeGraphWidget(QtWidgets.QWidget):
             or gui_node.nk_node.Class() in ("Group", "LiveGroup")
         ):
             return
-        nodes = []
-
-        node = gui_node.nk_node
+        if self.nav_bar.getHead() == gui_node:
+            return
 
+        nodes = []
+        node = gui_node.nk_node.parent()
         while node:
             nodes.insert(0, self._view.guiNodeFromPath(node.path()))
             node = node.parent()
 
-        if self.nav_bar.getHead() == gui_node:
-            return
+        # Only the target scene is shown, the parents only need to be in the nav_bar.
         self.nav_bar.clear()
         for node in nodes:
-            self._view.stepIntoNode(node)
+            self.nav_bar.addItem(node)
+        self._view.stepIntoNode(gui_node)
 
 
 def __test() -> None:
@@ -14,6 +14,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import functools
 import math
 from typing import Dict, List, Optional, Tuple, Type, Union
 
@@ -22,29 +23,26 @@ import networkx as nx
 from nkview import constants
 from nkview.qt import QtCore, QtGui, QtWidgets, PYSIDE6
 from nuke_parser.parser import Node
-from nuke_parser.stack import Stack
 
 SCALE = 80
 
-EDGE_LENGTH_MIN = 0.1
 ARROW_SIZE_CONNECTED = 7
 ARROW_HEAD_ANGLE = (3 * math.pi) / 15
 
+_ARROW_SIZE = ARROW_SIZE_CONNECTED * 2
+_ARROW_HALF_COS = math.cos(ARROW_HEAD_ANGLE / 2)
+_ARROW_HALF_SIN = math.sin(ARROW_HEAD_ANGLE / 2)
+
 
 def polygonToLines(polygon: QtGui.QPolygonF) -> List[QtCore.QLineF]:
-    lines = []
-    for i in range(polygon.size()):
-        lines.append(
-            QtCore.QLineF(
-                polygon[i],
-                polygon[(i + 1) % polygon.size()],  # wrap around to the first point
-            )
-        )
-    return lines
+    points = list(polygon)
+    # Pair every point with the next one, wrap around to the first point.
+    return [QtCore.QLineF(a, b) for a, b in zip(points, points[1:] + points[:1])]
 
 
+@functools.lru_cache(maxsize=None)
 def defaultNodeColor(class_: str) -> QtGui.QColor:
-    """Get default node color from node class.
+    """Get default node color from node class. Shared between callers, don't modify it.
 
     Args:
         class_: Node class to get color for.
@@ -57,43 +55,79 @@ def defaultNodeColor(class_: str) -> QtGui.QColor:
     return QtGui.QColor(name)
 
 
-@dataclass()
+@dataclass(frozen=True)
 class Shape:
-    """Class holding node shape."""
+    """Class holding node shape. Shared between nodes, don't modify."""
 
     polygon: QtGui.QPolygonF  # Polygon to draw the node shape.
     outline: QtGui.QPainterPath  # Outline of node shape.
     selected: QtGui.QPolygonF  # Polygon to draw selected node.
+    bounds: QtCore.QRectF  # Bounding rect of ``polygon``.
+    edges: List[QtCore.QLineF]  # Edges of ``polygon``.
 
 
-def _createShape(points: Tuple[Tuple[float, float], ...], scale: float = 1.0) -> Shape:
+def _createShape(points: QtGui.QPolygonF, scale: float = 1.0) -> Shape:
     """Create shape object from node points
 
     Args:
-        points: 2D node vertices of shape.
+        points: 2D node vertices of shape (unit size).
         scale: Vertical scale of node shape.
 
     """
-    outline = QtGui.QPolygonF()
-    selected = QtGui.QPolygonF()
-
-    for p in [QtCore.QPointF(p[0] * SCALE, p[1] * (SCALE * scale)) for p in points]:
-        outline.append(p)
-        selected.append(p)
+    outline = QtGui.QTransform.fromScale(SCALE, SCALE * scale).map(points)
 
     outline_path = QtGui.QPainterPath()
     outline_path.addPolygon(outline)
     outline_path.closeSubpath()
-    center = outline.boundingRect().center()
+    bounds = outline.boundingRect()
+    center = bounds.center()
 
+    # Shrink the outline around its center in one mapping.
     tf = QtGui.QTransform()
+    tf.translate(center.x(), center.y())
     tf.scale(0.9, 0.9)
-    selected = tf.map(selected)
+    tf.translate(-center.x(), -center.y())
+    selected = tf.map(outline)
+
+    return Shape(outline, outline_path, selected, bounds, polygonToLines(outline))
+
+
+_SHAPE_CACHE: Dict[Tuple[int, float], Shape] = {}
 
-    offset = center - selected.boundingRect().center()
-    selected.translate(offset.x(), offset.y())
 
-    return Shape(outline, outline_path, selected)
+def _sharedShape(points: QtGui.QPolygonF, scale: float = 1.0) -> Shape:
+    """Get shape object from node points, created once per points and scale.
+
+    Args:
+        points: 2D node vertices of shape (unit size), a shape from ``constants``.
+        scale: Vertical scale of node shape.
+
+    Returns:
+        Shape of node.
+
+    """
+    key = (id(points), scale)  # The shapes in ``constants`` live as long as the module.
+    shape = _SHAPE_CACHE.get(key)
+    if shape is None:
+        shape = _SHAPE_CACHE[key] = _createShape(points, scale)
+    return shape
+
+
+# Node class to (shape points, if the shape is scaled vertically).
+_CLASS_SHAPES: Dict[str, Tuple[QtGui.QPolygonF, bool]] = {
+    "Scene": (constants.SCENE_3D_SHAPE, False),
+    "GeoScene": (constants.SCENE_3D_SHAPE, False),
+    "Camera3": (constants.SCENE_3D_SHAPE, False),
+    "CameraTrackerPointCloud": (constants.GEO_SHAPE, True),
+    "ModelBuilder": (constants.GEO_SHAPE, True),
+    "Viewer": (constants.VIEWER_SHAPE, True),
+    "Switch": (constants.VIEWER_SHAPE, True),
+    "Read": (constants.READ_SHAPE, False),
+    "Group": (constants.GROUP_SHAPE, True),
+    "Output": (constants.OUTPUT_SHAPE, True),
+    "Input": (constants.INPUT_SHAPE, True),
+    "Dot": (constants.DOT_SHAPE, False),
+}
 
 
 def shapeFromClass(node: Node, scale: float = 1.0) -> Shape:
@@ -107,32 +141,21 @@ def shapeFromClass(node: Node, scale: float = 1.0) -> Shape:
         Shape of node.
 
     """
-
     if node.isGizmo():
-        return _createShape(constants.GIZMO_SHAPE, scale)
-
-    class_name = node.Class()
-    if class_name in ("Scene", "GeoScene", "Camera3"):
-        return _createShape(constants.SCENE_3D_SHAPE)
-    elif class_name in ("CameraTrackerPointCloud", "ModelBuilder"):
-        return _createShape(constants.GEO_SHAPE, scale)
-    elif class_name in ("Viewer", "Switch"):
-        return _createShape(constants.VIEWER_SHAPE, scale)
-    elif class_name == "Read":
-        return _createShape(constants.READ_SHAPE)
-    elif class_name == "Group":
-        return _createShape(constants.GROUP_SHAPE, scale)
-    elif class_name == "Output":
-        return _createShape(constants.OUTPUT_SHAPE, scale)
-    elif class_name == "Input":
-        return _createShape(constants.INPUT_SHAPE, scale)
-    elif class_name == "Dot":
-        return _createShape(constants.DOT_SHAPE)
-    return _createShape(constants.BASE_SHAPE, scale)
+        return _sharedShape(constants.GIZMO_SHAPE, scale)
+
+    points, use_scale = _CLASS_SHAPES.get(node.Class(), (constants.BASE_SHAPE, True))
+    return _sharedShape(points, scale if use_scale else 1.0)
 
 
+@functools.lru_cache(maxsize=256)
 def nukeColorToRgb(num: str) -> QtGui.QColor:
-    """Convert nuke 32 bit hex to 8 bit rgb."""
+    """Convert nuke 32 bit hex to 8 bit rgb.
+
+    Scripts reuse the same tile colors, the color is shared between callers, don't
+    modify it.
+
+    """
     hex_value = int(num, 16)
     red = (hex_value >> 24) & 0xFF
     green = (hex_value >> 16) & 0xFF
@@ -140,6 +163,44 @@ def nukeColorToRgb(num: str) -> QtGui.QColor:
     return QtGui.QColor(red, green, blue)
 
 
+def _arrowHeadOffsets(
+    dx: float, dy: float
+) -> Tuple[float, float, float, float, float, float]:
+    """Get the arrow head corners and input name position of a connection line.
+
+    Plain float math, no Qt objects are created.
+
+    Args:
+        dx: Horizontal length of line (from arrow tip).
+        dy: Vertical length of line (from arrow tip).
+
+    Returns:
+        x, y offsets from the arrow tip of the two head corners and the text position.
+
+    """
+    a = math.atan2(dy, dx)
+    # Rotate the line direction by +/- half the head angle with the angle addition
+    # formulas instead of evaluating cos / sin for each arrow point.
+    cos_a = math.cos(a) * _ARROW_SIZE
+    sin_a = math.sin(a) * _ARROW_SIZE
+    return (
+        cos_a * _ARROW_HALF_COS - sin_a * _ARROW_HALF_SIN,
+        sin_a * _ARROW_HALF_COS + cos_a * _ARROW_HALF_SIN,
+        cos_a * _ARROW_HALF_COS + sin_a * _ARROW_HALF_SIN,
+        sin_a * _ARROW_HALF_COS - cos_a * _ARROW_HALF_SIN,
+        cos_a,
+        sin_a,
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _cloneIconFont() -> QtGui.QFont:
+    """Font of the clone icon (created on first use, after the ``QApplication``)."""
+    font = QtGui.QFont()
+    font.setPixelSize(9)
+    return font
+
+
 class ConnectionLine(QtWidgets.QGraphicsLineItem):
     """Class representing connection line."""
 
@@ -159,40 +220,23 @@ class ConnectionLine(QtWidgets.QGraphicsLineItem):
 
         line = QtCore.QLineF(target.center(), source.center())
 
-        polygon = self.mapFromItem(self.target, self.target._shape_cls.polygon)
-        edges = polygonToLines(polygon)
-        for edge in edges:
-            _type, point = edge.intersects(line)
+        # Clip the line against the (shared) edges of the target shape in the target's
+        # coordinates instead of mapping the polygon to the scene for every line.
+        target_pos = self.target.pos()
+        local_line = line.translated(-target_pos)
+        for edge in self.target._shape_cls.edges:
+            _type, point = edge.intersects(local_line)
             if _type == QtCore.QLineF.BoundedIntersection:
-                line = QtCore.QLineF(point, self.source.center())
+                line = QtCore.QLineF(point + target_pos, self.source.center())
                 break
 
-        self.setLine(line)
-
-        a = math.acos(line.dx() / max(EDGE_LENGTH_MIN, line.length()))
-        if line.dy() < 0:
-            a = 2 * math.pi - a
-
-        arrow_size = ARROW_SIZE_CONNECTED * 2
-        arrow_p1 = line.p1() + QtCore.QPointF(
-            math.cos(a + ARROW_HEAD_ANGLE / 2) * arrow_size,
-            math.sin(a + ARROW_HEAD_ANGLE / 2) * arrow_size,
-        )
-
-        arrow_p2 = line.p1() + QtCore.QPointF(
-            math.cos(a - ARROW_HEAD_ANGLE / 2) * arrow_size,
-            math.sin(a - ARROW_HEAD_ANGLE / 2) * arrow_size,
+        x1, y1, x2, y2, text_x, text_y = _arrowHeadOffsets(line.dx(), line.dy())
+        p1 = line.p1()
+        self.text_pos = p1 + QtCore.QPointF(text_x, text_y)
+        self.arrow_head = QtGui.QPolygonF(
+            [p1, p1 + QtCore.QPointF(x1, y1), p1 + QtCore.QPointF(x2, y2)]
         )
 
-        self.text_pos = line.p1() + QtCore.QPointF(
-            math.cos(a) * arrow_size,
-            math.sin(a) * arrow_size,
-        )
-
-        self.arrow_head = QtGui.QPolygonF()
-        for p in [line.p1(), arrow_p1, arrow_p2]:
-            self.arrow_head.append(p)
-
         line_with_offset = QtCore.QLineF(line.p2(), line.p1())
         line_with_offset.setLength(line_with_offset.length() - ARROW_SIZE_CONNECTED)
 
@@ -254,15 +298,16 @@ class StickyNoteNode(QtWidgets.QGraphicsRectItem):
     def __init__(self, nk_node: Node):
         super().__init__()
         self.nk_node = nk_node
+        self.node_path = nk_node.path()
         self.setPos(QtCore.QPoint(self.nk_node.xpos(), self.nk_node.ypos()))
 
-        font = QtGui.QFont()
-        font.setPointSize(nk_node.knob("note_font_size", 14))
-        fm = QtGui.QFontMetrics(font)
-        text = nk_node.knob("label")
-        width = max([100] + [fm.horizontalAdvance(line) for line in text.split("\n")])
+        self._font = QtGui.QFont()
+        self._font.setPointSizeF(nk_node.knob("note_font_size", 14))
+        fm = QtGui.QFontMetrics(self._font)
+        lines = nk_node.knob("label").split("\n")
+        width = max(100, *(fm.horizontalAdvance(line) for line in lines))
 
-        height = fm.height() * len(text.split("\n"))
+        height = fm.height() * len(lines)
 
         self.setRect(QtCore.QRect(0, 0, width + 10, height))
         self.setBrush(QtGui.QColor(204, 205, 118))
@@ -285,9 +330,7 @@ class StickyNoteNode(QtWidgets.QGraphicsRectItem):
         super().paint(painter, option, widget)
         painter.save()
 
-        font = QtGui.QFont()
-        font.setPointSize(self.nk_node.knob("note_font_size", 14))
-        painter.setFont(font)
+        painter.setFont(self._font)
         draw_rect = self.rect()
         draw_rect.setLeft(draw_rect.left())
         draw_rect.setTop(draw_rect.top())
@@ -307,6 +350,7 @@ class BackdropNode(QtWidgets.QGraphicsRectItem):
     def __init__(self, nk_node: Node):
         super().__init__()
         self.nk_node = nk_node
+        self.node_path = nk_node.path()
         self.setPos(QtCore.QPoint(self.nk_node.xpos(), self.nk_node.ypos()))
 
         self.setRect(
@@ -326,9 +370,70 @@ class BackdropNode(QtWidgets.QGraphicsRectItem):
             nukeColorToRgb(color_text) if color_text else QtGui.QColor(130, 130, 130)
         )
 
+        self._local_center = self.rect().center()  # The rect is fixed.
+        self._label_font = QtGui.QFont()
+        self._label_font.setPointSizeF(self.nk_node.knob("note_font_size", 14) * 0.5)
+
+        # The rect and color never change, lay out the decorations once.
+        rect = self.rect()
+        color = self.brush().color()
+        self._name_color = color.lighter(118)
+        self._corner_color = color.lighter(130)
+        self._text_color = (
+            QtCore.Qt.white if color.lightness() < 80 else QtCore.Qt.black
+        )
+
+        offset = 20
+        self._name_rect = QtCore.QRectF(rect)
+        self._name_rect.setTop(self._name_rect.top() + 3)
+        self._name_rect.setLeft(self._name_rect.left() + offset)
+        self._name_rect.setRight(self._name_rect.right() - offset)
+        self._name_rect.setBottom(self._name_rect.top() + offset)
+
+        top_left = rect.topLeft() + QtCore.QPointF(1, 1)
+        top_right = rect.topRight() + QtCore.QPointF(-1, 1)
+        bottom_right = rect.bottomRight() + QtCore.QPointF(-1, -1)
+        bottom_left = rect.bottomLeft() + QtCore.QPointF(1, -1)
+        self._corner_polygons = (
+            QtGui.QPolygonF(
+                [
+                    top_left,
+                    top_left + QtCore.QPointF(offset, 0),
+                    top_left + QtCore.QPointF(0, offset),
+                ]
+            ),  # Top left
+            QtGui.QPolygonF(
+                [
+                    top_right,
+                    top_right + QtCore.QPointF(0, offset),
+                    top_right + QtCore.QPointF(-offset, 0),
+                ]
+            ),  # Top right
+            QtGui.QPolygonF(
+                [
+                    bottom_right,
+                    bottom_right + QtCore.QPointF(-offset, 0),
+                    bottom_right + QtCore.QPointF(0, -offset),
+                ]
+            ),  # Bottom right
+            QtGui.QPolygonF(
+                [
+                    bottom_left,
+                    bottom_left + QtCore.QPointF(0, -offset),
+                    bottom_left + QtCore.QPointF(offset, 0),
+                ]
+            ),
+        )
+
+        offset = 10
+        self._label_rect = QtCore.QRectF(rect)
+        self._label_rect.setLeft(self._label_rect.left() + offset)
+        self._label_rect.setTop(self._name_rect.bottom())
+        self._label_rect.setRight(self._label_rect.right() - offset)
+
     def center(self) -> QtCore.QPoint:
         """Get center of node."""
-        return self.pos() + self.rect().center()
+        return self.pos() + self._local_center
 
     def paint(
         self,
@@ -347,75 +452,27 @@ class BackdropNode(QtWidgets.QGraphicsRectItem):
         super().paint(painter, option, widget)
 
         # Draw node name
-        offset = 20
-        name_rect = QtCore.QRectF(self.rect())
-        name_rect.setTop(name_rect.top() + 3)
-        name_rect.setLeft(name_rect.left() + offset)
-        name_rect.setRight(name_rect.right() - offset)
-        name_rect.setBottom(name_rect.top() + offset)
-
-        color = self.brush().color()
-        painter.fillRect(name_rect, color.lighter(118))
+        painter.fillRect(self._name_rect, self._name_color)
         painter.drawText(
-            name_rect,
+            self._name_rect,
             QtCore.Qt.AlignHCenter | QtCore.Qt.AlignVCenter,
             self.nk_node.nodeName(),
         )
 
         # Draw corners
-
-        top_left = self.rect().topLeft() + QtCore.QPointF(1, 1)
-        top_right = self.rect().topRight() + QtCore.QPointF(-1, 1)
-        bottom_right = self.rect().bottomRight() + QtCore.QPointF(-1, -1)
-        bottom_left = self.rect().bottomLeft() + QtCore.QPointF(1, -1)
-        poyls = (
-            [
-                top_left,
-                top_left + QtCore.QPointF(offset, 0),
-                top_left + QtCore.QPointF(0, offset),
-            ],  # Top left
-            [
-                top_right,
-                top_right + QtCore.QPointF(0, offset),
-                top_right + QtCore.QPointF(-offset, 0),
-            ],  # Top right
-            [
-                bottom_right,
-                bottom_right + QtCore.QPointF(-offset, 0),
-                bottom_right + QtCore.QPointF(0, -offset),
-            ],  # Bottom right
-            [
-                bottom_left,
-                bottom_left + QtCore.QPointF(0, -offset),
-                bottom_left + QtCore.QPointF(offset, 0),
-            ],
-        )
         painter.save()
-        painter.setBrush(self.brush().color().lighter(130))
+        painter.setBrush(self._corner_color)
         painter.setPen(QtCore.Qt.NoPen)
-        for points in poyls:
-            painter.drawPolygon(points)
+        for polygon in self._corner_polygons:
+            painter.drawPolygon(polygon)
         painter.restore()
 
-        font = QtGui.QFont()
-        font.setPointSize(self.nk_node.knob("note_font_size", 14) * 0.5)
         painter.save()
-        painter.setFont(font)
+        painter.setFont(self._label_font)
 
-        offset = 10
-        draw_rect = self.rect()
-        draw_rect.setLeft(draw_rect.left() + offset)
-        draw_rect.setTop(name_rect.bottom())
-        draw_rect.setRight(draw_rect.right() - offset)
-
-        text_color = (
-            QtCore.Qt.white
-            if self.brush().color().lightness() < 80
-            else QtCore.Qt.black
-        )
-        painter.setPen(text_color)
+        painter.setPen(self._text_color)
         painter.drawText(
-            draw_rect,
+            self._label_rect,
             QtCore.Qt.AlignLeft | QtCore.Qt.AlignTop | QtCore.Qt.TextWordWrap,
             self.nk_node.knob("label"),
         )
@@ -428,13 +485,18 @@ class DagNode(QtWidgets.QGraphicsItem):
     def __init__(self, nk_node: Node):
         super(DagNode, self).__init__()
         self._shape_cls = shapeFromClass(nk_node)
+        self._layout_rect: Optional[QtCore.QRectF] = None
+        self._local_center = self._shape_cls.bounds.center()
 
         self.nk_node = nk_node
+        self.node_path = nk_node.path()  # Names are static, avoid walking parents.
         if nk_node.Class() != "Root":
             self.setZValue(1)
             self.setPos(QtCore.QPoint(self.nk_node.xpos(), self.nk_node.ypos()))
 
         self.setFlag(QtWidgets.QGraphicsItem.ItemIsSelectable)
+        # Paint the gradient and text once into a pixmap and blit it while panning.
+        self.setCacheMode(QtWidgets.QGraphicsItem.CacheMode.DeviceCoordinateCache)
 
         hex_color = self.nk_node.knob("tile_color")
         self.node_color = (
@@ -443,23 +505,42 @@ class DagNode(QtWidgets.QGraphicsItem):
             else defaultNodeColor(self.nk_node.Class())
         )
 
+        self._text_color = (
+            QtCore.Qt.white if self.node_color.lightness() < 100 else QtCore.Qt.black
+        )
+
+        # The color and shape never change, build the fill brush once.
+        m_gradient = QtGui.QLinearGradient(0, 0, 0, self._shape_cls.bounds.height())
+        m_gradient.setColorAt(0.0, self.node_color.lighter(150))
+        m_gradient.setColorAt(0.5, self.node_color)
+        m_gradient.setColorAt(1.0, self.node_color.lighter(70))
+        self._brush = QtGui.QBrush(m_gradient)
+
     def nodeText(self) -> str:
         return self.nk_node.name()
 
     def nodeShapePointsInWorldSpace(self) -> List[QtCore.QPointF]:
         return [self.pos() + point for point in self._shape_cls.polygon]
 
+    def layoutRect(self) -> QtCore.QRectF:
+        """Get rect of node and its label, the label is laid out against it."""
+        if self._layout_rect is None:
+            # Measure the label once, Qt asks for the bounding rect on every repaint.
+            font = QtGui.QFont()
+            fm = QtGui.QFontMetrics(font)
+            width = fm.horizontalAdvance(self.nodeText())
+            rect = QtCore.QRectF(self._shape_cls.bounds)
+            if width > rect.width():
+                delta = width - rect.width()
+                rect.setLeft(rect.left() - delta // 2)
+                rect.setRight(rect.right() + delta // 2)
+            self._layout_rect = rect
+        return QtCore.QRectF(self._layout_rect)
+
     def boundingRect(self) -> QtCore.QRectF:
         """Get bounding rect of node."""
-        font = QtGui.QFont()
-        fm = QtGui.QFontMetrics(font)
-        width = fm.horizontalAdvance(self.nodeText())
-        rect = self._shape_cls.polygon.boundingRect()
-        if width > rect.width():
-            delta = width - rect.width()
-            rect.setLeft(rect.left() - delta // 2)
-            rect.setRight(rect.right() + delta // 2)
-        return rect
+        # Leave room for the outline and the 3px disabled cross.
+        return self.layoutRect().adjusted(-2, -2, 2, 2)
 
     def shape(self) -> QtGui.QPainterPath:
         """Get outline of node."""
@@ -467,7 +548,7 @@ class DagNode(QtWidgets.QGraphicsItem):
 
     def center(self) -> QtCore.QPoint:
         """Get center of node."""
-        return self.pos() + self._shape_cls.polygon.boundingRect().center()
+        return self.pos() + self._local_center
 
     def paint(
         self,
@@ -486,14 +567,7 @@ class DagNode(QtWidgets.QGraphicsItem):
         painter.save()
         painter.setPen(QtGui.QPen(QtCore.Qt.black, 1))
 
-        m_gradient = QtGui.QLinearGradient(
-            0, 0, 0, self._shape_cls.polygon.boundingRect().height()
-        )
-        m_gradient.setColorAt(0.0, self.node_color.lighter(150))
-        m_gradient.setColorAt(0.5, self.node_color)
-        m_gradient.setColorAt(1.0, self.node_color.lighter(70))
-
-        painter.setBrush(m_gradient)
+        painter.setBrush(self._brush)
         painter.drawPolygon(self._shape_cls.polygon)
 
         if self.isSelected():
@@ -506,7 +580,7 @@ class DagNode(QtWidgets.QGraphicsItem):
         if self.nk_node.disable():
             painter.save()
             painter.setPen(QtGui.QPen(QtCore.Qt.black, 3))
-            rect = self._shape_cls.polygon.boundingRect()
+            rect = self._shape_cls.bounds
 
             lines = [
                 QtCore.QLineF(rect.topLeft(), rect.bottomRight()),
@@ -517,13 +591,11 @@ class DagNode(QtWidgets.QGraphicsItem):
 
         # Draw clone icon
         if self.nk_node.isClone():
-            top_left = self._shape_cls.polygon.boundingRect().topLeft()
+            top_left = self._shape_cls.bounds.topLeft()
             text_rect = QtCore.QRectF(top_left, top_left + QtCore.QPointF(10, 10))
             painter.save()
             painter.setPen(QtGui.QPen(QtCore.Qt.black, 1))
-            font = QtGui.QFont()
-            font.setPixelSize(9)
-            painter.setFont(font)
+            painter.setFont(_cloneIconFont())
             painter.setBrush(QtGui.QColor(208, 112, 80))
             painter.drawEllipse(text_rect)
             painter.setPen(QtCore.Qt.white)
@@ -532,7 +604,7 @@ class DagNode(QtWidgets.QGraphicsItem):
             )
             painter.restore()
 
-        text_rect = QtCore.QRectF(self.boundingRect())
+        text_rect = self.layoutRect()
         text_rect.setTop(text_rect.top() + 2)
         if self.nk_node.Class() != "Dot":
             vlayout = (
@@ -541,15 +613,7 @@ class DagNode(QtWidgets.QGraphicsItem):
                 else QtCore.Qt.AlignVCenter
             )
 
-            text_color = (
-                QtCore.Qt.white
-                if self.node_color.lightness() < 100
-                else QtCore.Qt.black
-            )
-            painter.setPen(text_color)
-            font = QtGui.QFont()
-            font.setPointSize(self.nk_node.knob("note_font_size", 10) * 0.5)
-
+            painter.setPen(self._text_color)
             painter.drawText(
                 text_rect,
                 self.nodeText(),
@@ -568,7 +632,7 @@ class GroupNode(DagNode):
 
     def __init__(self, nk_node: Node, scene_map: Dict[str, DagNode]):
         super(GroupNode, self).__init__(nk_node)
-        scene_map[nk_node.path()] = self
+        scene_map[self.node_path] = self
         self._scene = NkScene(nk_node, scene_map, self)
         self._viewport_rect = None
 
@@ -600,6 +664,13 @@ class GroupNode(DagNode):
 GuiNode = Union[DagNode, BackdropNode, StickyNoteNode]
 
 
+# Gui node classes of nodes without children.
+_GUI_NODE_CLASSES: Dict[str, Type[GuiNode]] = {
+    "StickyNote": StickyNoteNode,
+    "BackdropNode": BackdropNode,
+}
+
+
 def getNodeClass(node: Node) -> Type[GuiNode]:
     """Get gui node class from node.
 
@@ -612,11 +683,7 @@ def getNodeClass(node: Node) -> Type[GuiNode]:
     """
     if node.children() or node.Class() == "Group":
         return GroupNode
-    return {
-        "Group": GroupNode,
-        "StickyNote": StickyNoteNode,
-        "BackdropNode": BackdropNode,
-    }.get(node.Class(), DagNode)
+    return _GUI_NODE_CLASSES.get(node.Class(), DagNode)
 
 
 def niceInputName(index: int, Class: str) -> str:
@@ -641,26 +708,25 @@ class NkScene(QtWidgets.QGraphicsScene):
 
     def __init__(self, root: Node, scene_map: Dict[str, DagNode], parent: GroupNode):
         super().__init__()
+        # Don't maintain the index while items are added, it's built once at the end.
+        self.setItemIndexMethod(QtWidgets.QGraphicsScene.ItemIndexMethod.NoIndex)
         self._group_node = parent
-        node_map = {}
+        self._items_bounding_rect: Optional[QtCore.QRectF] = None
+        node_map: Dict[Node, DagNode] = {}
+        line_count = 0
         self._autoLayout(list(root.children()))
 
         for node in root.children():
             class_ = getNodeClass(node)
-            args = (
-                (node, scene_map)
-                if node.children() or node.Class() == "Group"
-                else (node,)
-            )
-            dag_node = class_(*args)
+            dag_node = class_(node, scene_map) if class_ is GroupNode else class_(node)
 
-            node_map[node.path()] = dag_node
-            scene_map[node.path()] = dag_node
+            node_map[node] = dag_node
+            scene_map[dag_node.node_path] = dag_node
             self.addItem(dag_node)
 
         for gui_node in node_map.values():
             for i, node in enumerate(gui_node.nk_node.inputs()):
-                out_node = node_map[node.path()]
+                out_node = node_map[node]
                 line = ConnectionLine(
                     niceInputName(i, gui_node.nk_node.Class()),
                     out_node,
@@ -668,11 +734,12 @@ class NkScene(QtWidgets.QGraphicsScene):
                     gui_node.nk_node.Class() == "Viewer",
                 )
                 self.addItem(line)
+                line_count += 1
 
             # Add clone line.
             clone_source_nk = gui_node.nk_node._source_node
-            if clone_source_nk and node_map[clone_source_nk.path()]:
-                source = node_map[clone_source_nk.path()]
+            if clone_source_nk and node_map[clone_source_nk]:
+                source = node_map[clone_source_nk]
 
                 line = QtWidgets.QGraphicsLineItem(
                     QtCore.QLineF(gui_node.center(), source.center())
@@ -680,6 +747,53 @@ class NkScene(QtWidgets.QGraphicsScene):
                 pen = QtGui.QPen(QtGui.QColor(211, 110, 75), 2)
                 line.setPen(pen)
                 self.addItem(line)
+                line_count += 1
+
+        # Build the index in one pass, sized from the node and edge counts.
+        item_count = len(node_map) + line_count
+        self.setItemIndexMethod(QtWidgets.QGraphicsScene.ItemIndexMethod.BspTreeIndex)
+        self.setBspTreeDepth(max(5, math.ceil(math.log2(item_count or 1))))
+
+    def addItem(self, item: QtWidgets.QGraphicsItem) -> None:
+        """Add item to scene.
+
+        Args:
+            item: Item to add.
+
+        """
+        super().addItem(item)
+        self._items_bounding_rect = None
+
+    def removeItem(self, item: QtWidgets.QGraphicsItem) -> None:
+        """Remove item from scene.
+
+        Args:
+            item: Item to remove.
+
+        """
+        super().removeItem(item)
+        self._items_bounding_rect = None
+
+    def itemsBoundingRect(self) -> QtCore.QRectF:
+        """Get the bounding rect of all items in scene.
+
+        Nodes can't be moved, so the rect is only computed again when items are added
+        or removed.
+
+        Returns:
+            Bounding rect of all items.
+
+        """
+        if self._items_bounding_rect is None:
+            # Nodes pad their bounding rect for the pen, frame the unpadded rect.
+            rect = QtCore.QRectF()
+            for item in self.items():
+                if isinstance(item, DagNode):
+                    rect = rect.united(item.mapRectToScene(item.layoutRect()))
+                else:
+                    rect = rect.united(item.sceneBoundingRect())
+            self._items_bounding_rect = rect
+        return QtCore.QRectF(self._items_bounding_rect)
 
     def groupNode(self) -> GroupNode:
         """Get the group node (the parent node of all nodes in the graphics scene).
@@ -703,28 +817,26 @@ class NkScene(QtWidgets.QGraphicsScene):
 
         """
         levels = {}
+        successors = G.succ  # Adjacency view, ``G.successors()`` builds an iterator.
         # Assign levels to each node
         for node in nx.topological_sort(G):
             if node in levels:
                 continue
-            level = 0
-            stack = Stack[Node]()
-            stack.push(node)
-            while not stack.empty():
+            levels[node] = 0
+            stack = [node]
+            while stack:
                 current = stack.pop()
-                levels.setdefault(current, level)
+                next_level = levels[current] + 1
 
-                for successor in G.successors(current):
+                for successor in successors[current]:
                     if successor not in levels:
-                        stack.push(successor)
-                        levels[successor] = levels[current] + 1
+                        stack.append(successor)
+                        levels[successor] = next_level
 
         # Group nodes by levels.
         level_nodes = {}
         for node, level in levels.items():
-            if level not in level_nodes:
-                level_nodes[level] = []
-            level_nodes[level].append(node)
+            level_nodes.setdefault(level, []).append(node)
         return level_nodes
 
     def _autoLayout(self, nodes: List[Node]) -> None:
@@ -751,6 +863,8 @@ class NkScene(QtWidgets.QGraphicsScene):
 
         level_nodes = self._assingLevels(G)
 
+        h_space = 5
+        v_space = 5
         # Align nodes in straight horizontal lines based on levels
         for level, nodes_in_level in level_nodes.items():
             # Sort nodes by their x positions if they exist
@@ -758,19 +872,17 @@ class NkScene(QtWidgets.QGraphicsScene):
                 nodes_in_level,
                 key=lambda n: (n.xpos() if n.xpos() is not None else float("inf")),
             )
-            nodes_geo = [
-                shapeFromClass(node).polygon.boundingRect() for node in sorted_nodes
-            ]
-            height = max(nodes_geo, key=lambda rect: rect.height()).height()
+            # Read the sizes once into plain lists instead of querying rects per use.
+            nodes_geo = [shapeFromClass(node).bounds for node in sorted_nodes]
+            widths = [rect.width() for rect in nodes_geo]
+            height = max(rect.height() for rect in nodes_geo)
 
-            h_space = 5
-            v_space = 5
             x = start_x + h_space
-            for i, node in enumerate(sorted_nodes):
+            for node, width in zip(sorted_nodes, widths):
                 if node.xpos() is None or node.ypos() is None:
                     node.setXpos(x)
                     node.setYpos(start_y)
-                x += nodes_geo[i].width() + h_space
+                x += width + h_space
             start_y += height + v_space
 
     @staticmethod
@@ -790,26 +902,28 @@ class NkScene(QtWidgets.QGraphicsScene):
         ]
 
         top_nodes = []
+        # The depth first search up the graph always continues with the last input, the
+        # top node of every node on that chain is the same. Shared between all searches.
+        top_cache: Dict[Node, Optional[Node]] = {}
 
         for node in nodes_without_position:
             # Traverse up to find the top-most node
-            top_node = None
-            visited = set()
-            stack = Stack[Node]()
-            stack.push(node)
-
-            while stack:
-                current = stack.pop()
-                if current in visited:
-                    continue
-                visited.add(current)
-
-                if not any(current.inputs()):  # Node with no inputs is a top node
-                    top_node = current
+            chain = {}  # Insertion ordered set.
+            current = node
+            while current not in top_cache:
+                inputs = current.inputs()
+                if not inputs:  # Node with no inputs is a top node
+                    top_cache[current] = current
                     break
-                else:
-                    for n in filter(None, current.inputs()):
-                        stack.push(n)
+                if current in chain:
+                    top_cache[current] = None  # Cycle, no top node.
+                    break
+                chain[current] = None
+                current = inputs[-1]
+
+            top_node = top_cache[current]
+            for n in chain:
+                top_cache[n] = top_node
 
             if top_node and top_node.xpos() is not None and top_node.ypos() is not None:
                 top_nodes.append(top_node)
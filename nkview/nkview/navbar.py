@@ -11,8 +11,9 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import bisect
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from nkview.constants import SELECTED_COLOR
 from nkview.gui_nodes import GroupNode
@@ -26,6 +27,8 @@ class PrivateShape:
     poly: QtGui.QPolygonF
     path: QtGui.QPainterPath
     node: GroupNode
+    rect: QtCore.QRectF
+    not_first: bool
 
 
 class NavigationBar(QtWidgets.QWidget):
@@ -44,12 +47,21 @@ class NavigationBar(QtWidgets.QWidget):
         super(NavigationBar, self).__init__(parent)
         self.setMouseTracking(True)
         self._items: List[GroupNode] = []
+        self._shapes: Optional[List[PrivateShape]] = None
+        # Left edge of each shape in self._shapes, used to bisect hit tests.
+        self._x_starts: List[float] = []
+        # Shape under the cursor at the last mouse move.
+        self._hovered: Optional[PrivateShape] = None
+        # Cursor position from the last mouse move. None when outside the widget.
+        self._cursor_pos: Optional[QtCore.QPoint] = None
+        # Text advance per node name, only valid for the current font.
+        self._advance_cache: Dict[str, int] = {}
 
     def minimumSizeHint(self) -> QtCore.QSize:
         """Widget size hint."""
         height = QtGui.QFontMetrics(self.font()).height() + 10
         width = (
-            sum(shape.poly.boundingRect().width() for shape in self._getShapes()) or 1
+            sum(shape.rect.width() for shape in self._getShapes()) or 1
         )
         return QtCore.QSize(width, height)
 
@@ -61,7 +73,30 @@ class NavigationBar(QtWidgets.QWidget):
 
         """
         super(NavigationBar, self).mouseMoveEvent(event)
-        self.update()
+        self._cursor_pos = event.pos()
+        self._setHovered(self._shapeAt(self._cursor_pos))
+
+    def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
+        """Process resize event.
+
+        Args:
+            event: Event to process.
+
+        """
+        super(NavigationBar, self).resizeEvent(event)
+        self._invalidateShapes()
+
+    def changeEvent(self, event: QtCore.QEvent) -> None:
+        """Process change event.
+
+        Args:
+            event: Event to process.
+
+        """
+        super(NavigationBar, self).changeEvent(event)
+        if event.type() == QtCore.QEvent.FontChange:
+            self._advance_cache.clear()
+            self._invalidateShapes()
 
     def leaveEvent(self, event: QtCore.QEvent) -> None:
         """Process mouse leave event.
@@ -71,7 +106,8 @@ class NavigationBar(QtWidgets.QWidget):
 
         """
         super(NavigationBar, self).leaveEvent(event)
-        self.update()
+        self._cursor_pos = None
+        self._setHovered(None)
 
     def mousePressEvent(self, event: QtGui.QMouseEvent) -> None:
         """Process mouse press event.
@@ -84,11 +120,10 @@ class NavigationBar(QtWidgets.QWidget):
             super(NavigationBar, self).mousePressEvent(event)
             return
 
-        for shape in self._getShapes():
-            if self._cursorAbove(shape):
-                self._setTailItem(shape.node)
-                event.accept()
-                break
+        shape = self._shapeAt(event.pos())
+        if shape:
+            self._setTailItem(shape.node)
+            event.accept()
 
     def paintEvent(self, event: QtGui.QPaintEvent) -> None:
         """Process paint event.
@@ -99,11 +134,22 @@ class NavigationBar(QtWidgets.QWidget):
         """
         painter = QtGui.QPainter(self)
         painter.setRenderHint(QtGui.QPainter.Antialiasing)
-        for shape in self._getShapes():
+        pos = self._cursor_pos
+        if pos is None:
+            pos = self.mapFromGlobal(QtGui.QCursor.pos())
+        hovered = self._shapeAt(pos)
+        shapes = self._getShapes()
+        # Only paint shapes touching the dirty rect, grown by the outline width.
+        dirty = QtCore.QRectF(event.rect()).adjusted(-1, -1, 1, 1)
+        # Start one shape early since its arrow tip reaches into the next shape.
+        start = max(bisect.bisect_right(self._x_starts, dirty.left()) - 2, 0)
+        for shape in shapes[start:]:
+            if shape.rect.left() > dirty.right():
+                break
+            if not shape.rect.intersects(dirty):
+                continue
             color = (
-                QtGui.QColor(SELECTED_COLOR)
-                if self._cursorAbove(shape)
-                else QtCore.Qt.gray
+                QtGui.QColor(SELECTED_COLOR) if shape is hovered else QtCore.Qt.gray
             )
             painter.setPen(QtCore.Qt.black)
             painter.fillPath(shape.path, QtGui.QBrush(color))
@@ -111,7 +157,7 @@ class NavigationBar(QtWidgets.QWidget):
 
             painter.setPen(QtCore.Qt.white)
             painter.drawText(
-                shape.poly.boundingRect(),
+                shape.rect,
                 QtCore.Qt.AlignCenter,
                 str(shape.node.name()),
             )
@@ -124,29 +170,77 @@ class NavigationBar(QtWidgets.QWidget):
             item: New tail item.
 
         """
-        index = self._items.index(node) + 1
-        while index < len(self._items):
-            self._items.pop(index)
-        self.update()
+        del self._items[self._items.index(node) + 1 :]
+        self._invalidateShapes()
         self.change_path.emit(node)
 
     def clear(self) -> None:
         """Clear all items."""
         self._items = []
+        self._invalidateShapes()
+
+    def _invalidateShapes(self) -> None:
+        """Rebuild the shapes on next use and repaint widget."""
+        self._shapes = None
+        self._hovered = None
+        self.updateGeometry()
         self.update()
 
-    def _cursorAbove(self, shape: PrivateShape) -> bool:
+    def _setHovered(self, shape: Optional[PrivateShape]) -> None:
+        """Set hovered shape and repaint the shapes whose highlight changed.
+
+        Args:
+            shape: Shape under the cursor or None.
+
+        """
+        if shape is self._hovered:
+            return
+        for changed in (self._hovered, shape):
+            if changed:
+                # Grow by a pixel to include the antialiased outline.
+                self.update(changed.rect.adjusted(-1, -1, 1, 1).toAlignedRect())
+        self._hovered = shape
+
+    def _shapeAt(self, pos: QtCore.QPoint) -> Optional[PrivateShape]:
+        """Find the shape under the cursor.
+
+        Args:
+            pos: Cursor position in widget coordinates.
+
+        Returns:
+            Shape under the cursor or None.
+
+        """
+        shapes = self._getShapes()
+        index = bisect.bisect_right(self._x_starts, pos.x()) - 1
+        # The arrow tip of the previous shape reaches past the start of the next.
+        for shape in reversed(shapes[max(index - 1, 0) : index + 1]):
+            if self._cursorAbove(shape, pos):
+                return shape
+        return None
+
+    def _cursorAbove(self, shape: PrivateShape, pos: QtCore.QPoint) -> bool:
         """Check if the cursor is above the shape obj.
 
         Args:
             shape: Shape object to check.
+            pos: Cursor position in widget coordinates.
 
         Returns:
             True if cursor is above shape.
 
         """
-        pos = self.mapFromGlobal(QtGui.QCursor.pos())
-        return shape.poly.containsPoint(pos, QtCore.Qt.WindingFill)
+        x, y = pos.x(), pos.y()
+        rect = shape.rect
+        height = rect.height()
+        if not (rect.left() <= x <= rect.right() and 0 <= y <= height) or not height:
+            return False
+
+        # Both arrows reach ARROW_DELTA at half height and zero at top and bottom.
+        arrow = self._ARROW_DELTA * (1 - abs(2 * y - height) / height)
+        if x > rect.right() - self._ARROW_DELTA + arrow:
+            return False
+        return not shape.not_first or x >= rect.left() + arrow
 
     def _createShape(
         self,
@@ -182,14 +276,13 @@ class NavigationBar(QtWidgets.QWidget):
         if not_first:
             positions.append(QtCore.QPointF(left + self._ARROW_DELTA, height / 2))
 
-        polygon = QtGui.QPolygonF()
-        for point in positions:
-            polygon.append(point)
+        polygon = QtGui.QPolygonF(positions)
 
         path = QtGui.QPainterPath()
         path.addPolygon(polygon)
         path.closeSubpath()
-        return PrivateShape(polygon, path, item)
+        rect = QtCore.QRectF(left, 0, width + self._ARROW_DELTA, height)
+        return PrivateShape(polygon, path, item, rect, not_first)
 
     def getHead(self) -> GroupNode:
         """Get the latest node in navigation bar.
@@ -210,8 +303,7 @@ class NavigationBar(QtWidgets.QWidget):
         if self.getHead() == node:
             return
         self._items.append(node)
-        self.updateGeometry()
-        self.update()
+        self._invalidateShapes()
 
     def _getShapes(self) -> List[PrivateShape]:
         """Get shape objects to draw.
@@ -220,13 +312,22 @@ class NavigationBar(QtWidgets.QWidget):
             Shape nodes to draw and check for hover and mouse click.
 
         """
+        if self._shapes is not None:
+            return self._shapes
+
         fm = QtGui.QFontMetrics(self.font())
         left = self.rect().left()
         shapes = []
         for i, node in enumerate(self._items):
-            width = fm.horizontalAdvance(node.name()) + 30  # 30 is the offset
+            name = node.name()
+            advance = self._advance_cache.get(name)
+            if advance is None:
+                advance = self._advance_cache[name] = fm.horizontalAdvance(name)
+            width = advance + 30  # 30 is the offset
             shapes.append(
                 self._createShape(left, width, self.rect().height(), node, bool(i))
             )
             left += width + 2
+        self._shapes = shapes
+        self._x_starts = [shape.rect.left() for shape in shapes]
         return shapes
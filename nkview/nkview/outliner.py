@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import re
-from typing import Any, List, Optional, Union
+from typing import Any, Dict, List, Optional, Set, Union
 
 from nkview.qt import QtCore, QtGui, QtWidgets
 from nuke_parser.parser import Node
@@ -25,14 +25,42 @@ NodeFullNameRole = QtCore.Qt.UserRole + 3
 class NodeItem(QtGui.QStandardItem):
     """Class representing outliner tree item of nuke node."""
 
+    # Icons shared by all items, keyed by icon name.
+    _ICON_CACHE: Dict[str, QtGui.QIcon] = {}
+    # Shared by classes without an icon, e.g. gizmos and third party plugins.
+    _EMPTY_ICON: Optional[QtGui.QIcon] = None
+
     def __init__(self, node: Node):
         super(NodeItem, self).__init__()
         self.node = node
-        self._icon = (
-            QtGui.QIcon(":nuke_types/Group.png")
-            if node.children()
-            else QtGui.QIcon(f":nuke_types/{self.node.Class()}.png")
-        )
+        icon_name = "Group" if node.children() else node.Class()
+        icon = self._ICON_CACHE.get(icon_name)
+        if icon is None:
+            icon = self._ICON_CACHE[icon_name] = self._loadIcon(icon_name)
+        self._icon = icon
+
+        flags = QtCore.Qt.ItemFlag.ItemIsEnabled
+        if node.Class() != "Root":
+            flags |= QtCore.Qt.ItemFlag.ItemIsSelectable
+        self.setFlags(flags)
+
+    @classmethod
+    def _loadIcon(cls, icon_name: str) -> QtGui.QIcon:
+        """Load icon from resources.
+
+        Args:
+            icon_name: Name of icon to load.
+
+        Returns:
+            Icon or an empty shared icon if there is no icon with that name.
+
+        """
+        path = f":nuke_types/{icon_name}.png"
+        if QtCore.QFile.exists(path):
+            return QtGui.QIcon(path)
+        if cls._EMPTY_ICON is None:
+            NodeItem._EMPTY_ICON = QtGui.QIcon()
+        return cls._EMPTY_ICON
 
     def data(self, role: int = ...) -> Any:
         """Returns the data stored under the given role.
@@ -59,6 +87,10 @@ class OutlinerModel(QtGui.QStandardItemModel):
     def __init__(self):
         super(OutlinerModel, self).__init__()
         self._zoom_factor = 1.0
+        # Font and size hint shared by all rows. Updated when zooming.
+        self._font = QtGui.QFont()
+        self._font.setPointSizeF(12)
+        self._size_hint = QtCore.QSize(0, 25)
 
     def zoomFactor(self) -> float:
         """Get zoom factor. Value to use when multiplying scale of row and font."""
@@ -67,6 +99,8 @@ class OutlinerModel(QtGui.QStandardItemModel):
     def setZoomFactor(self, value: float):
         """Set zoom factor for the item. Value to scale the  row and font by."""
         self._zoom_factor = value
+        self._font.setPointSizeF(12 * value)
+        self._size_hint = QtCore.QSize(0, 25) * value
 
     def data(self, index: QtCore.QModelIndex, role: int = ...) -> Any:
         """Request data from model.
@@ -80,34 +114,25 @@ class OutlinerModel(QtGui.QStandardItemModel):
 
         """
         if role == QtCore.Qt.ItemDataRole.FontRole:
-            font = QtGui.QFont()
-            font.setPointSizeF(12 * self.zoomFactor())
-            return font
+            return self._font
         elif role == QtCore.Qt.ItemDataRole.SizeHintRole:
-            return QtCore.QSize(0, 25) * self.zoomFactor()
+            return self._size_hint
         return super().data(index, role)
 
-    def flags(self, index: QtCore.QModelIndex) -> QtCore.Qt.ItemFlag:
-        """Returns the item flags for the given index.
-
-        Args:
-            index: Model index to query.
-
-        Returns:
-            Flags for given index.
-
-        """
-        flags = QtCore.Qt.ItemFlag.ItemIsEnabled
-        if index.data(NodeClassRole) != "Root":
-            flags |= QtCore.Qt.ItemFlag.ItemIsSelectable
-
-        return flags
-
 
 class OutlinerFilterModel(QtCore.QSortFilterProxyModel):
     def __init__(self, source_model: OutlinerModel):
         super(OutlinerFilterModel, self).__init__()
         self.filter: Union[None, re.Pattern] = None
+        # Nodes accepted by the current filter. Built on demand.
+        self._accepted: Optional[Set[Node]] = None
+        # Node paths of leaf nodes, kept between filter changes.
+        self._paths: Dict[Node, str] = {}
+        # Connect before setSourceModel so the cache is dropped before the proxy
+        # filters the new rows.
+        source_model.modelReset.connect(self._clearAcceptedCache)
+        source_model.rowsInserted.connect(self._clearAcceptedCache)
+        source_model.rowsRemoved.connect(self._clearAcceptedCache)
         self.setSourceModel(source_model)
 
     def setFilter(self, pattern: Union[re.Pattern, None]):
@@ -118,8 +143,54 @@ class OutlinerFilterModel(QtCore.QSortFilterProxyModel):
 
         """
         self.filter = pattern
+        self._accepted = None
         self.invalidateFilter()
 
+    def _clearAcceptedCache(self, *args) -> None:
+        """Drop cached filter result when the source model changes."""
+        self._accepted = None
+        self._paths = {}
+
+    def _acceptedNodes(self) -> Set[Node]:
+        """Get nodes that pass the filter.
+
+        Leaf nodes are accepted if their path matches the filter and nodes with
+        children are accepted if any child is accepted.
+
+        Returns:
+            Accepted nodes.
+
+        """
+        if self._accepted is not None:
+            return self._accepted
+
+        model = self.sourceModel()
+        stack = [model.item(row).node for row in range(model.rowCount())]
+        order = []
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            stack.extend(node.children())
+
+        accepted = set()
+        paths = self._paths
+        search = self.filter.search
+        # Children come after their parent in order, so walk it backwards.
+        for node in reversed(order):
+            children = node.children()
+            if children:
+                if any(child in accepted for child in children):
+                    accepted.add(node)
+                continue
+
+            path = paths.get(node)
+            if path is None:
+                path = paths[node] = node.path()
+            if search(path):
+                accepted.add(node)
+        self._accepted = accepted
+        return accepted
+
     def filterAcceptsRow(
         self, source_row: int, source_parent: QtCore.QModelIndex
     ) -> bool:
@@ -136,24 +207,21 @@ class OutlinerFilterModel(QtCore.QSortFilterProxyModel):
         if not source_parent.isValid():
             return True  # Deal with root index.
 
-        index = self.sourceModel().index(source_row, 0, source_parent)
-        for row in range(self.sourceModel().rowCount(index)):
-            if self.filterAcceptsRow(row, index):
-                return True
-
-        if self.sourceModel().rowCount(index):
-            return False
+        if not self.filter:
+            return True
 
-        if self.filter and not self.filter.search(index.data(NodePathRole)):
-            return False
-        return True
+        model = self.sourceModel()
+        item = model.itemFromIndex(model.index(source_row, 0, source_parent))
+        return item.node in self._acceptedNodes()
 
 
 class TreeView(QtWidgets.QTreeView):
     def __init__(self, parent: Optional[QtWidgets.QWidget]):
         super(TreeView, self).__init__(parent)
 
-        self._scene_map = {}
+        self._scene_map: Dict[str, NodeItem] = {}
+        # Items not yet added to self._scene_map. Mapped on demand by itemFromPath.
+        self._unmapped_items: List[NodeItem] = []
 
         self.source_model = OutlinerModel()
         self.filter_model = OutlinerFilterModel(self.source_model)
@@ -183,18 +251,30 @@ class TreeView(QtWidgets.QTreeView):
 
     def buildTree(self, root: Node):
         """Populate tree."""
+        self.setUpdatesEnabled(False)
         self.source_model.clear()
-        self._scene_map = {}
 
-        def build(node, parent) -> None:
-            item = NodeItem(node)
-            self._scene_map[node.path()] = item
-            parent.appendRow(item)
-            for child in node.children():
-                build(child, item)
+        # Build the items before adding them to the model so it only emits once.
+        root_item = NodeItem(root)
+        items = [root_item]
+        stack = [root_item]
+        while stack:
+            item = stack.pop()
+            children = [NodeItem(child) for child in item.node.children()]
+            if not children:
+                continue
+            item.appendRows(children)
+            items.extend(children)
+            stack.extend(children)
 
-        build(root, self.source_model.invisibleRootItem())
+        self._scene_map = {}
+        # Reverse so items are mapped from the root down when popped.
+        items.reverse()
+        self._unmapped_items = items
+
+        self.source_model.invisibleRootItem().appendRow(root_item)
         self.expandAll()
+        self.setUpdatesEnabled(True)
 
     def itemFromPath(self, path: str) -> Union[NodeItem, None]:
         """Get outliner tree item from node path.
@@ -206,7 +286,15 @@ class TreeView(QtWidgets.QTreeView):
             Outliner item.
 
         """
-        return self._scene_map.get(path)
+        item = self._scene_map.get(path)
+        # Map more items until the path is found or all items are mapped.
+        while item is None and self._unmapped_items:
+            unmapped = self._unmapped_items.pop()
+            unmapped_path = unmapped.node.path()
+            self._scene_map[unmapped_path] = unmapped
+            if unmapped_path == path:
+                item = unmapped
+        return item
 
 
 class OutlinerWidget(QtWidgets.QWidget):
@@ -219,11 +307,17 @@ class OutlinerWidget(QtWidgets.QWidget):
     def __init__(self, parent: QtWidgets.QWidget = None):
         super(OutlinerWidget, self).__init__(parent)
         self._selection_blocked = False
+        # Set when the filter proxy shows rows that were hidden.
+        self._rows_shown = False
 
         #####################
         # Create Widgets:
         self._search_lineedit = QtWidgets.QLineEdit()
         self._view = TreeView(self)
+        # Wait for a pause in typing before filtering the tree.
+        self._filter_timer = QtCore.QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(50)
 
         #####################
         # Widget settings:
@@ -248,7 +342,9 @@ class OutlinerWidget(QtWidgets.QWidget):
         #####################
         # Setup signals:
 
-        self._search_lineedit.textChanged.connect(self._updateFilterCallback)
+        self._search_lineedit.textChanged.connect(lambda: self._filter_timer.start())
+        self._filter_timer.timeout.connect(self._updateFilterCallback)
+        self._view.filter_model.rowsInserted.connect(self._rowsShownCallback)
         self._view.selectionModel().selectionChanged.connect(self._selectionCallback)
         self._view.doubleClicked.connect(self._navigateCallback)
 
@@ -284,11 +380,21 @@ class OutlinerWidget(QtWidgets.QWidget):
         """Text search callback."""
         text = self._search_lineedit.text()
 
-        # Search with new text and expand tree.
+        # Search with new text.
+        self._rows_shown = False
         self._view.filter_model.setFilter(
             re.compile(text, flags=re.IGNORECASE) if text else None
         )
-        self._view.expandAll()
+        # Rows the filter brings back are collapsed. If the filter only hid rows
+        # the tree is still expanded.
+        if self._rows_shown:
+            self._view.setUpdatesEnabled(False)
+            self._view.expandAll()
+            self._view.setUpdatesEnabled(True)
+
+    def _rowsShownCallback(self, *args) -> None:
+        """Callback to track when rows are added to the filter proxy."""
+        self._rows_shown = True
 
     def selectNodes(self, nodePaths: List[str]) -> None:
         """Select node pahts in tree-view.
@@ -299,12 +405,18 @@ class OutlinerWidget(QtWidgets.QWidget):
         """
         self._selection_blocked = True
 
-        nodes = filter(None, [self._view.itemFromPath(path) for path in nodePaths])
-        indices = [
-            self._view.filter_model.mapFromSource(node.index()) for node in nodes
-        ]
-
-        self._view.selectionModel().clear()
-        for index in indices:
-            self._view.selectionModel().select(index, QtCore.QItemSelectionModel.Select)
+        item_from_path = self._view.itemFromPath
+        map_from_source = self._view.filter_model.mapFromSource
+        selection = QtCore.QItemSelection()
+        for path in nodePaths:
+            item = item_from_path(path)
+            if item is None:
+                continue
+            index = map_from_source(item.index())
+            if index.isValid():  # Invalid if hidden by the filter.
+                selection.select(index, index)
+
+        self._view.selectionModel().select(
+            selection, QtCore.QItemSelectionModel.ClearAndSelect
+        )
         self._selection_blocked = False
@@ -25,6 +25,10 @@ try:
     QtGui.QMouseEvent.pos = get_pos
     QtWidgets.QAction = QtGui.QAction
 
+    from PySide6 import QtOpenGLWidgets
+
+    QtWidgets.QOpenGLWidget = QtOpenGLWidgets.QOpenGLWidget
+
 except ImportError:
     from PySide2 import QtCore, QtGui, QtWebEngineWidgets, QtWidgets
 
@@ -13,10 +13,10 @@
 # limitations under the License.
 from __future__ import annotations
 
-import copy
 import json
 import logging
 import os
+import tempfile
 from typing import Any, Callable, List
 
 from nkview.qt import QtCore, QtWidgets
@@ -45,18 +45,23 @@ def addRecentlyOpened(file_path: str) -> None:
             config_data = json.load(f)
         file_paths = config_data.get("recently_opened", [])
 
-    if file_path in file_paths:
-        file_paths.remove(file_path)
-
-    file_paths.insert(0, file_path)
-
+    # Move file_path to the front while keeping the order of the others.
+    file_paths = list(dict.fromkeys([file_path, *file_paths]))
     config_data["recently_opened"] = file_paths[:_MAX_COUNT]
+    tmp_path = None
     try:
         os.makedirs(_CONFIG_ROOT, exist_ok=True)
-        with open(_NKVIEW_SETTINGS, "w") as f:
+        # Write to a unique temp file first so a failed write or another nkview
+        # process saving at the same time can't corrupt the settings.
+        fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=_CONFIG_ROOT)
+        with os.fdopen(fd, "w") as f:
             json.dump(config_data, f, indent=4)
-    except PermissionError:
-        LOG.error("No Permission to save file")
+        os.replace(tmp_path, _NKVIEW_SETTINGS)
+    except OSError as error:
+        LOG.error("Failed to save %s: %s", _NKVIEW_SETTINGS, error)
+    finally:
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
 
 
 def recentlyOpened() -> List[str]:
@@ -64,7 +69,7 @@ def recentlyOpened() -> List[str]:
     if not os.path.exists(_NKVIEW_SETTINGS):
         return []
     with open(_NKVIEW_SETTINGS, "r") as f:
-        return copy.deepcopy(json.load(f).get("recently_opened", []))
+        return json.load(f).get("recently_opened", [])
 
 
 class WaitCursorContext(object):